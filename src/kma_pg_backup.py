@@ -57,7 +57,7 @@ class PostgreSQLBackupManager:
             self.database_name = None
         
         self._setup_logging()
-        self.remote_storage = RemoteStorageManager(self.config)
+        self.remote_storage = RemoteStorageManager(self.config, self.logger)
         self.retention_manager = RetentionManager(self.config, self.logger)
         
         # Get remote retention settings
@@ -423,6 +423,7 @@ def main():
                        help='Validate retention configuration and exit')
     
     args = parser.parse_args()
+    manager = None
     
     try:
         # Determine configuration mode
@@ -503,6 +504,10 @@ def main():
     except Exception as e:
         print(f"Critical error: {e}")
         sys.exit(1)
+    finally:
+        # Release remote storage connections kept open for reuse
+        if manager:
+            manager.remote_storage.close()
 
 
 if __name__ == "__main__":
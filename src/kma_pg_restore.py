@@ -55,7 +55,7 @@ class PostgreSQLRestoreManager:
             self.database_name = None
         
         self._setup_logging()
-        self.remote_storage = RemoteStorageManager(self.config)
+        self.remote_storage = RemoteStorageManager(self.config, self.logger)
         
     def _load_legacy_config(self, config_path: str) -> Dict:
         """Load configuration from YAML or JSON file"""
@@ -478,6 +478,7 @@ def main():
         if not args.database and not args.database_config:
             parser.error("--database/-d or --database-config is required")
     
+    manager = None
     try:
         # Determine configuration mode
         if args.database_config:
@@ -549,6 +550,10 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        # Log out of pooled remote sessions and unmount a CIFS share mounted for listing or download
+        if manager:
+            manager.remote_storage.close()
 
 
 if __name__ == "__main__":
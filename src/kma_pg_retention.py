@@ -10,16 +10,42 @@ Module for managing advanced backup retention policies with multi-level storage
 """
 
 import os
+import time
 import logging
-from datetime import datetime, timedelta
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import re
 
 
+# File extensions treated as backups
+_BACKUP_SUFFIXES = ('.dump', '.sql', '.gz', '.bz2')
+
+_SECONDS_PER_DAY = 86400.0
+
+# Filesystems where each unlink is a network round trip
+_NETWORK_FS_TYPES = frozenset(('nfs', 'nfs4', 'cifs', 'smb3', 'smbfs',
+                               'fuse.sshfs', 'davfs', 'fuse.davfs2'))
+_NETWORK_DELETE_WORKERS = 8
+
+# Retention buckets, used as indexes into per-bucket cutoff tuples
+BUCKET_DAILY, BUCKET_WEEKLY, BUCKET_MONTHLY, BUCKET_UNKNOWN = 0, 1, 2, 3
+_BUCKET_NAMES = ('daily', 'weekly', 'monthly', 'unknown')
+
+# Retention settings in bucket order; max_age applies to the unknown bucket
+_RETENTION_KEYS = ('daily', 'weekly', 'monthly', 'max_age')
+# Deletion throttling settings in backup.retention; they are not a retention policy
+_DELETE_TUNING_KEYS = ('delete_chunk_size', 'delete_chunk_sleep_ms', 'delete_workers')
+
+
 class RetentionManager:
     """Manager for advanced backup retention policies"""
     
+    # Explicit backup type markers in filenames, matched in a single scan
+    _TYPE_RE = re.compile(r'(daily|day|weekly|week|monthly|month)', re.IGNORECASE)
+    _TYPE_BY_PREFIX = {'d': BUCKET_DAILY, 'w': BUCKET_WEEKLY, 'm': BUCKET_MONTHLY}
+    
     def __init__(self, config: Dict, logger: logging.Logger = None):
         """Initialize retention manager with configuration"""
         self.config = config
@@ -29,30 +55,46 @@ class RetentionManager:
         # Get retention settings with fallback to legacy settings
         self.retention_config = self.backup_config.get('retention', {})
         self.legacy_retention_days = self.backup_config.get('retention_days', 30)
+        self.legacy_mode = all(key in _DELETE_TUNING_KEYS for key in self.retention_config)
+        
+        # Deletion throttling: remove files in chunks with a pause between them
+        self.delete_chunk_size = max(1, self._tuning_setting('delete_chunk_size', 64, int))
+        self.delete_chunk_sleep = max(0.0, self._tuning_setting('delete_chunk_sleep_ms', 50, float)) / 1000.0
+        # Parallel unlinks: 0 = auto-detect from the filesystem type of the backup directory
+        self.delete_workers = max(0, self._tuning_setting('delete_workers', 0, int))
         
-        # Parse retention settings
-        self.local_retention = self._parse_retention_config('local')
-        self.remote_retention = self._parse_retention_config('remote')
+        # Parse retention settings once; periods are indexed by bucket id
+        self._local_periods = self._parse_retention_config('local')
+        self._remote_periods = self._parse_retention_config('remote')
+        self.local_retention = dict(zip(_RETENTION_KEYS, self._local_periods))
+        self.remote_retention = dict(zip(_RETENTION_KEYS, self._remote_periods))
+        # With one period for every bucket (always true in legacy mode) bucketing can be skipped
+        self._local_uniform = len(set(self._local_periods)) == 1
+        self._remote_uniform = len(set(self._remote_periods)) == 1
+    
+    def _tuning_setting(self, key: str, default, convert):
+        """Read a deletion throttling setting, falling back to the default when malformed"""
+        value = self.retention_config.get(key, default)
+        try:
+            return convert(value)
+        except (TypeError, ValueError):
+            self.logger.warning(f"Invalid retention setting {key}: {value!r}, using {default}")
+            return default
     
-    def _parse_retention_config(self, storage_type: str) -> Dict[str, int]:
+    def _parse_retention_config(self, storage_type: str) -> Tuple[int, int, int, int]:
         """Parse retention configuration for specific storage type"""
         retention = self.retention_config.get(storage_type, {})
         
         # If no advanced retention is configured, use legacy settings
         if not retention:
-            return {
-                'daily': self.legacy_retention_days,
-                'weekly': self.legacy_retention_days,
-                'monthly': self.legacy_retention_days,
-                'max_age': self.legacy_retention_days
-            }
+            return (self.legacy_retention_days,) * 4
         
-        return {
-            'daily': retention.get('daily', 30),
-            'weekly': retention.get('weekly', 60),
-            'monthly': retention.get('monthly', 365),
-            'max_age': retention.get('max_age', 365)
-        }
+        return (
+            retention.get('daily', 30),
+            retention.get('weekly', 60),
+            retention.get('monthly', 365),
+            retention.get('max_age', 365)
+        )
     
     def cleanup_old_backups(self, backup_dir: str, storage_type: str = 'local') -> Dict[str, int]:
         """
@@ -70,7 +112,10 @@ class RetentionManager:
             self.logger.warning(f"Backup directory not found: {backup_dir}")
             return {'deleted': 0, 'kept': 0, 'errors': 0}
         
-        retention = self.local_retention if storage_type == 'local' else self.remote_retention
+        if storage_type == 'local':
+            periods, uniform = self._local_periods, self._local_uniform
+        else:
+            periods, uniform = self._remote_periods, self._remote_uniform
         
         # Get all backup files
         backup_files = self._get_backup_files(backup_path)
@@ -78,109 +123,147 @@ class RetentionManager:
             self.logger.info(f"No backup files found in {backup_dir}")
             return {'deleted': 0, 'kept': 0, 'errors': 0}
         
-        # Categorize files by backup type and age
-        categorized_files = self._categorize_backup_files(backup_files)
+        # Cutoff timestamps are computed once per run, not per file
+        now_ts = time.time()
+        cutoffs = tuple(now_ts - days * _SECONDS_PER_DAY for days in periods)
+        
+        workers = self.delete_workers or self._detect_delete_workers(backup_path)
         
-        # Apply retention policy
-        stats = self._apply_retention_policy(categorized_files, retention, storage_type)
+        # Categorize files and apply retention policy in one pass
+        if uniform:
+            stats = self._sweep_uniform(backup_files, periods[BUCKET_UNKNOWN],
+                                        cutoffs[BUCKET_UNKNOWN], workers)
+        else:
+            stats = self._sweep(backup_files, periods, cutoffs, now_ts, workers)
         
         self.logger.info(f"Retention cleanup completed for {storage_type} storage: "
                         f"deleted={stats['deleted']}, kept={stats['kept']}, errors={stats['errors']}")
         
         return stats
     
-    def _get_backup_files(self, backup_path: Path) -> List[Path]:
-        """Get all backup files from directory"""
-        backup_files = []
-        for file_path in backup_path.iterdir():
-            if file_path.is_file() and file_path.suffix in ['.dump', '.sql', '.gz', '.bz2']:
-                backup_files.append(file_path)
-        return sorted(backup_files, key=lambda x: x.stat().st_mtime, reverse=True)
-    
-    def _categorize_backup_files(self, backup_files: List[Path]) -> Dict[str, List[Path]]:
-        """Categorize backup files by type (daily, weekly, monthly)"""
-        now = datetime.now()
-        categorized = {
-            'daily': [],
-            'weekly': [],
-            'monthly': [],
-            'unknown': []
-        }
+    def _get_backup_files(self, backup_path: Path) -> List[os.DirEntry]:
+        """Get all backup files from directory, newest first"""
+        # DirEntry caches stat() results, so mtime is fetched once per file
+        with os.scandir(backup_path) as entries:
+            backup_files = [entry for entry in entries
+                            if entry.name.endswith(_BACKUP_SUFFIXES) and entry.is_file()]
+        return sorted(backup_files, key=lambda entry: entry.stat().st_mtime, reverse=True)
+    
+    def _detect_delete_workers(self, backup_path: Path) -> int:
+        """Pick the number of parallel unlinks based on the filesystem of backup_path"""
+        try:
+            target = os.path.realpath(backup_path)
+            fs_type = ''
+            best = -1
+            # The longest mount point that prefixes the directory is its filesystem
+            with open('/proc/mounts') as mounts:
+                for line in mounts:
+                    fields = line.split()
+                    if len(fields) < 3:
+                        continue
+                    mount_point = fields[1].replace('\\040', ' ')
+                    if (target == mount_point or
+                            target.startswith(mount_point.rstrip('/') + '/')) and len(mount_point) > best:
+                        best = len(mount_point)
+                        fs_type = fields[2]
+        except OSError:
+            return 1
+        return _NETWORK_DELETE_WORKERS if fs_type in _NETWORK_FS_TYPES else 1
+    
+    def _determine_backup_type(self, entry: os.DirEntry, age_days: int) -> int:
+        """Determine backup bucket index based on filename and age"""
+        # Check for explicit type indicators in filename
+        match = self._TYPE_RE.search(entry.name)
+        if match:
+            return self._TYPE_BY_PREFIX[match.group(1)[0].lower()]
+        
+        # Determine type based on age
+        return (BUCKET_DAILY if age_days <= 30 else
+                BUCKET_WEEKLY if age_days <= 90 else
+                BUCKET_MONTHLY if age_days <= 365 else
+                BUCKET_UNKNOWN)
+    
+    def _sweep(self, backup_files: List[os.DirEntry], periods: Tuple[int, ...],
+               cutoffs: Tuple[float, ...], now_ts: float, workers: int = 1) -> Dict[str, int]:
+        """Categorize backup files and apply retention policy in a single pass"""
+        stats = {'deleted': 0, 'kept': 0, 'errors': 0}
+        to_delete = []
         
-        for file_path in backup_files:
-            file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-            age_days = (now - file_time).days
+        for entry in backup_files:
+            mtime_ts = entry.stat().st_mtime
+            age_days = int((now_ts - mtime_ts) // _SECONDS_PER_DAY)
             
-            # Determine backup type based on filename pattern and age
-            backup_type = self._determine_backup_type(file_path, age_days)
-            categorized[backup_type].append(file_path)
+            # Determine backup bucket based on filename pattern and age
+            idx = self._determine_backup_type(entry, age_days)
+            
+            if mtime_ts < cutoffs[idx]:
+                if idx == BUCKET_UNKNOWN:
+                    reason = f"older than {periods[idx]} days"
+                else:
+                    reason = f"{_BUCKET_NAMES[idx]} backup older than {periods[idx]} days"
+                to_delete.append((entry, reason))
+            else:
+                stats['kept'] += 1
         
-        return categorized
-    
-    def _determine_backup_type(self, file_path: Path, age_days: int) -> str:
-        """Determine backup type based on filename and age"""
-        filename = file_path.name.lower()
+        deleted, errors = self._batch_delete(to_delete, workers)
+        stats['deleted'] += deleted
+        stats['errors'] += errors
         
-        # Check for explicit type indicators in filename
-        if 'daily' in filename or 'day' in filename:
-            return 'daily'
-        elif 'weekly' in filename or 'week' in filename:
-            return 'weekly'
-        elif 'monthly' in filename or 'month' in filename:
-            return 'monthly'
-        
-        # Determine type based on age and file pattern
-        if age_days <= 30:
-            return 'daily'
-        elif age_days <= 90:
-            return 'weekly'
-        elif age_days <= 365:
-            return 'monthly'
-        else:
-            return 'unknown'
+        return stats
     
-    def _apply_retention_policy(self, categorized_files: Dict[str, List[Path]], 
-                               retention: Dict[str, int], storage_type: str) -> Dict[str, int]:
-        """Apply retention policy to categorized files"""
+    def _sweep_uniform(self, backup_files: List[os.DirEntry], retention_days: int,
+                       cutoff_ts: float, workers: int = 1) -> Dict[str, int]:
+        """Apply a retention policy whose buckets all share one period"""
         stats = {'deleted': 0, 'kept': 0, 'errors': 0}
-        now = datetime.now()
+        reason = f"older than {retention_days} days"
+        
+        # Every file has the same cutoff, so the backup type does not matter
+        to_delete = [(entry, reason) for entry in backup_files
+                     if entry.stat().st_mtime < cutoff_ts]
+        stats['kept'] = len(backup_files) - len(to_delete)
+        
+        deleted, errors = self._batch_delete(to_delete, workers)
+        stats['deleted'] += deleted
+        stats['errors'] += errors
+        
+        return stats
+    
+    def _batch_delete(self, to_delete: List[Tuple[os.DirEntry, str]], workers: int = 1) -> Tuple[int, int]:
+        """Delete collected backup files in chunks, returning (deleted, errors) counts"""
+        deleted = 0
+        errors = 0
+        chunk_size = self.delete_chunk_size
+        workers = min(workers, len(to_delete))
         
-        for backup_type, files in categorized_files.items():
-            if backup_type == 'unknown':
-                # For unknown files, use max_age
-                max_age = retention['max_age']
-                cutoff_date = now - timedelta(days=max_age)
+        # On network filesystems unlink latency is a round trip, so overlap them
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            for start in range(0, len(to_delete), chunk_size):
+                # Pause between chunks so the filesystem can settle (discards, metadata)
+                if start and self.delete_chunk_sleep > 0:
+                    time.sleep(self.delete_chunk_sleep)
                 
-                for file_path in files:
-                    file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_time < cutoff_date:
-                        if self._delete_file(file_path, f"older than {max_age} days"):
-                            stats['deleted'] += 1
-                        else:
-                            stats['errors'] += 1
-                    else:
-                        stats['kept'] += 1
-            else:
-                # For known backup types, apply specific retention
-                retention_days = retention.get(backup_type, retention['max_age'])
-                cutoff_date = now - timedelta(days=retention_days)
+                chunk = to_delete[start:start + chunk_size]
+                if executor:
+                    results = executor.map(lambda item: self._delete_file(*item), chunk)
+                else:
+                    results = (self._delete_file(entry, reason) for entry, reason in chunk)
                 
-                for file_path in files:
-                    file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_time < cutoff_date:
-                        if self._delete_file(file_path, f"{backup_type} backup older than {retention_days} days"):
-                            stats['deleted'] += 1
-                        else:
-                            stats['errors'] += 1
+                for ok in results:
+                    if ok:
+                        deleted += 1
                     else:
-                        stats['kept'] += 1
-        
-        return stats
+                        errors += 1
+        finally:
+            if executor:
+                executor.shutdown()
+        return deleted, errors
     
-    def _delete_file(self, file_path: Path, reason: str) -> bool:
-        """Delete a backup file with logging"""
+    def _delete_file(self, file_path, reason: str) -> bool:
+        """Delete a backup file (Path or DirEntry) with logging"""
         try:
-            file_path.unlink()
+            # os.unlink accepts both; DirEntry.path is already a plain string
+            os.unlink(file_path)
             self.logger.info(f"Deleted {file_path.name}: {reason}")
             return True
         except Exception as e:
@@ -189,18 +272,30 @@ class RetentionManager:
     
     def get_retention_summary(self) -> Dict[str, Any]:
         """Get summary of current retention policy"""
+        return self._summary
+    
+    def validate_retention_config(self) -> List[str]:
+        """Validate retention configuration and return any issues"""
+        return self._validation_issues
+    
+    # Retention settings are fixed after __init__, so both results are computed once;
+    # delete the cached attribute after changing the configuration to recompute it
+    @cached_property
+    def _summary(self) -> Dict[str, Any]:
+        """Summary of current retention policy"""
         return {
             'local': self.local_retention,
             'remote': self.remote_retention,
-            'legacy_mode': not bool(self.retention_config)
+            'legacy_mode': self.legacy_mode
         }
     
-    def validate_retention_config(self) -> List[str]:
-        """Validate retention configuration and return any issues"""
+    @cached_property
+    def _validation_issues(self) -> List[str]:
+        """Retention configuration issues"""
         issues = []
         
         # Check if retention is configured
-        if not self.retention_config:
+        if self.legacy_mode:
             issues.append("No advanced retention policy configured, using legacy settings")
             return issues
         
@@ -10,27 +10,376 @@ Module for uploading backups to CIFS/Samba and WebDAV servers
 """
 
 import os
+import asyncio
+import errno
+import logging
+import functools
+import hashlib
+import io
 import shutil
+import socket
 import subprocess
 import tempfile
+import threading
+import time
+import weakref
 import ftplib
-from pathlib import Path
-from typing import Dict, Optional, List
-from datetime import datetime, timedelta
+import platform
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Dict, Optional, List, Tuple
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote, unquote, urlsplit
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 import requests
-from webdav3.client import Client
+from requests.adapters import HTTPAdapter
+
+try:
+    from webdav3.client import Client  # webdavclient3: needed only for WebDAV storage
+    from webdav3.exceptions import NoConnection, RemoteResourceNotFound
+except ImportError:
+    Client = None
+    
+    class NoConnection(Exception):
+        """Stand-in so except clauses work without webdavclient3"""
+    
+    class RemoteResourceNotFound(Exception):
+        """Stand-in so except clauses work without webdavclient3"""
+
+try:
+    import smbclient  # smbprotocol: optional direct SMB2 access without mounting
+except ImportError:
+    smbclient = None
+
+
+# Operating system, selects the CIFS mount command
+_SYSTEM = platform.system().lower()
+
+# Bytes handed to the kernel per copy_file_range()/sendfile() call
+_SENDFILE_CHUNK_SIZE = 1 << 20
+# Userspace buffer for copies the kernel cannot do on its own
+_COPY_BUFFER_SIZE = 4 << 20
+
+# Extensions of files that remote cleanup considers backups
+_BACKUP_SUFFIXES = ('.dump', '.sql', '.gz', '.bz2')
+# Extensions of files that list_backups() reports as restorable backups. Matched
+# with one str.endswith(tuple) call, which runs in C and measured several times
+# faster than splitting the extension off and looking it up in a set
+_LISTING_SUFFIXES = ('.dump', '.sql', '.dump.gz', '.sql.gz')
+
+# Already-compressed backups, sent as they are even when FTP MODE Z is enabled
+_COMPRESSED_SUFFIXES = ('.gz', '.bz2', '.zip')
+
+# Block size for network transfers (FTP, streamed WebDAV uploads)
+_TRANSFER_BLOCK_SIZE = 1 << 20
+# Kernel send/receive buffer for FTP data connections
+_DATA_SOCKET_BUFFER = 4 << 20
+
+# Files of at least this size may be split across parallel FTP streams
+_FTP_PARALLEL_THRESHOLD_MB = 256
+
+# Sidecar holding the BLAKE2b digest of an uploaded backup, used by skip_unchanged
+_DIGEST_SUFFIX = '.blake2b'
+
+# Linux mount.cifs options tuned for large sequential backup writes; cifs.mount_options
+# overrides them per key (a null value drops the option, e.g. to go back to cache=strict)
+_CIFS_MOUNT_OPTIONS = {'rsize': 1048576, 'wsize': 1048576, 'cache': 'loose', 'actimeo': 60}
+
+# WebDAV uploads of at least this size are streamed directly with requests
+_WEBDAV_STREAM_THRESHOLD = 64 << 20
+
+# errno values meaning copy_file_range()/sendfile() cannot be used for this pair of files
+_SENDFILE_UNSUPPORTED = (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK, errno.EOPNOTSUPP,
+                         errno.EXDEV, errno.EBADF)
+
+# PROPFIND body asking only for the properties cleanup needs
+_PROPFIND_BODY = (b'<?xml version="1.0" encoding="utf-8"?>'
+                  b'<propfind xmlns="DAV:"><prop>'
+                  b'<resourcetype/><getlastmodified/><getcontentlength/>'
+                  b'</prop></propfind>')
+# RFC 5323 SEARCH body matching only restorable backups in one directory, so
+# the server filters instead of returning every entry; {href} is the directory
+_SEARCH_BODY = ('<?xml version="1.0" encoding="utf-8"?>'
+                '<searchrequest xmlns="DAV:"><basicsearch>'
+                '<select><prop><resourcetype/></prop></select>'
+                '<from><scope><href>{href}</href><depth>1</depth></scope></from>'
+                '<where><or>'
+                + ''.join(f'<like><prop><displayname/></prop><literal>%{suffix}</literal></like>'
+                          for suffix in _LISTING_SUFFIXES)
+                + '</or></where>'
+                '</basicsearch></searchrequest>')
+
+# Pooled connections idle for longer than this are closed instead of reused
+_POOL_IDLE_TIMEOUT = 60.0
+# FTP connections idle for longer than this are checked with NOOP before reuse
+_FTP_NOOP_AFTER = 5.0
+# Keep-alive HTTP connections held per WebDAV session
+_HTTP_POOL_SIZE = 10
+
+# Parallel remote deletions during cleanup, each on its own pooled connection
+_DEFAULT_DELETE_WORKERS = 8
+
+# Seconds a backup listing is reused; empty listings (possibly a failed
+# connection) are cached for less so a recovered server is seen quickly
+_DEFAULT_LISTING_TTL = 30.0
+_EMPTY_LISTING_TTL = 5.0
+
+# Errors meaning a pooled connection was dropped and the operation may be retried
+_RECONNECT_ERRORS = (ftplib.error_temp, ConnectionError, EOFError,
+                     requests.ConnectionError, NoConnection)
+
+
+def _retry_on_disconnect(method):
+    """Retry a pooled-connection operation once if the connection was dropped"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except _RECONNECT_ERRORS:
+            # The failed connection was discarded, the retry opens a fresh one
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _copy_range(src_fd: int, dst_fd: int, offset: int) -> int:
+    """Copy one chunk with copy_file_range(), server-side on filesystems that support it"""
+    return os.copy_file_range(src_fd, dst_fd, _SENDFILE_CHUNK_SIZE, offset, offset)
+
+
+def _send_range(src_fd: int, dst_fd: int, offset: int) -> int:
+    """Copy one chunk with sendfile()"""
+    return os.sendfile(dst_fd, src_fd, offset, _SENDFILE_CHUNK_SIZE)
+
+
+# In-kernel copy methods, most efficient first
+_KERNEL_COPIES = tuple(copy for name, copy in (('copy_file_range', _copy_range),
+                                               ('sendfile', _send_range))
+                       if hasattr(os, name))
+
+
+def _parse_ftp_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an MLSD modify fact or MDTM reply (YYYYMMDDHHMMSS[.sss], UTC)"""
+    try:
+        return datetime.strptime(value[:14], '%Y%m%d%H%M%S').replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_http_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse a WebDAV getlastmodified value (RFC 1123 date) as an aware datetime"""
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _release_response(response: requests.Response, *args, **kwargs) -> requests.Response:
+    """Read a non-download WebDAV response so its connection returns to the keep-alive pool"""
+    # webdav3 sends every request with stream=True and rarely reads the body,
+    # which leaves the connection checked out and forces a new one per request.
+    # Downloads and PROPFIND/SEARCH multistatus bodies are always read by the
+    # caller, listings parse the latter while they stream in.
+    if response.request.method not in ('GET', 'PROPFIND', 'SEARCH'):
+        response.content
+    return response
+
+
+def _remove_cifs_credentials(creds: Tuple[str, Tuple[int, ...]]):
+    """Close or remove a mount.cifs credentials file"""
+    creds_path, pass_fds = creds
+    try:
+        if pass_fds:
+            os.close(pass_fds[0])
+        else:
+            os.unlink(creds_path)
+    except OSError:
+        pass  # Already gone
+
+
+def _unmount_share(mount_point: str, logger: logging.Logger):
+    """Unmount a CIFS share if it is still mounted"""
+    try:
+        if os.path.ismount(mount_point):
+            subprocess.run(['umount', mount_point], check=True)
+            logger.info("CIFS share unmounted from %s", mount_point)
+    except Exception as e:
+        logger.error("Error unmounting CIFS share: %s", e)
+
+
+def _release_remote_resources(pool_lock: threading.Lock, ftp_pool: List, webdav_pool: List,
+                              mount_lock: threading.Lock, mounted_points: Dict[str, bool],
+                              logger: logging.Logger):
+    """
+    Log out of pooled connections and unmount the shares a manager mounted
+    
+    Takes the manager's state rather than the manager, so it can also run from
+    a finalizer once the manager has been garbage collected.
+    """
+    with pool_lock:
+        ftp_conns = [ftp for ftp, _ in ftp_pool]
+        webdav_clients = [client for client, _ in webdav_pool]
+        ftp_pool.clear()
+        webdav_pool.clear()
+    
+    with mount_lock:
+        own_mounts = [point for point, owned in mounted_points.items() if owned]
+    for mount_point in own_mounts:
+        mounted_points.pop(mount_point, None)
+        _unmount_share(mount_point, logger)
+    
+    for ftp in ftp_conns:
+        try:
+            ftp.quit()
+        except Exception:
+            ftp.close()
+    
+    for client in webdav_clients:
+        client.session.close()
+
+
+class _FileChunks:
+    """Iterable over a file in fixed-size chunks read into one reusable buffer"""
+    
+    def __init__(self, path: str, chunk_size: int = _TRANSFER_BLOCK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.size = os.path.getsize(path)
+    
+    def __len__(self) -> int:
+        # Lets requests send Content-Length instead of chunked encoding
+        return self.size
+    
+    def __iter__(self):
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+        with open(self.path, 'rb') as file:
+            while True:
+                read = file.readinto(buffer)
+                if not read:
+                    break
+                yield view[:read]
+
+
+def _file_digest(path: str) -> str:
+    """BLAKE2b digest of a file, read through one reusable buffer"""
+    digest = hashlib.blake2b()
+    for chunk in _FileChunks(path):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _SessionReuseFTP_TLS(ftplib.FTP_TLS):
+    """FTP_TLS whose data connections resume the TLS session of the control connection"""
+    
+    def ntransfercmd(self, cmd, rest=None):
+        # Same as FTP_TLS.ntransfercmd, plus session= so each transfer skips the full
+        # handshake; servers such as vsftpd (require_ssl_reuse) insist on it
+        conn, size = ftplib.FTP.ntransfercmd(self, cmd, rest)
+        if self._prot_p:
+            conn = self.context.wrap_socket(conn, server_hostname=self.host,
+                                            session=self.sock.session)
+        return conn, size
 
 
 class RemoteStorageManager:
     """Manager for remote storage operations"""
     
-    def __init__(self, config: Dict):
-        """Initialize remote storage manager with configuration"""
+    def __init__(self, config: Dict, logger: logging.Logger = None, prewarm: bool = False):
+        """
+        Initialize remote storage manager with configuration
+        
+        With prewarm (or remote_storage.prewarm in the configuration), connections
+        to the configured backends are opened in a background thread right away.
+        """
         self.config = config
+        self.logger = logger or logging.getLogger(__name__)
         self.remote_config = config.get('backup', {}).get('remote_storage', {})
         self.enabled = self.remote_config.get('enabled', False)
         self.storage_type = self.remote_config.get('type', 'webdav')
+        # Per-backend settings, looked up once; the configuration is not changed after start-up
+        self._webdav_config = self.remote_config.get('webdav', {})
+        self._ftp_config = self.remote_config.get('ftp', {})
+        self._cifs_config = self.remote_config.get('cifs', {})
+        # webdav3 client options, built once for every client the pool creates
+        self._webdav_options = {
+            'webdav_hostname': self._webdav_config.get('url'),
+            'webdav_login': self._webdav_config.get('username'),
+            'webdav_password': self._webdav_config.get('password'),
+            'webdav_verify_ssl': self._webdav_config.get('verify_ssl', True)
+        }
+        # Skip uploading files whose remote copy has the same size and digest sidecar
+        self.skip_unchanged = bool(self.remote_config.get('skip_unchanged', False))
+        self.listing_ttl = self._numeric_setting(self.remote_config, 'listing_ttl',
+                                                 _DEFAULT_LISTING_TTL, float)
+        # Recent listings per storage type: (expiry on the monotonic clock, file names)
+        self._listing_cache: Dict[str, Tuple[float, List[str]]] = {}
+        self.delete_workers = max(1, self._numeric_setting(self.remote_config, 'delete_workers',
+                                                           _DEFAULT_DELETE_WORKERS, int))
         
+        # Serializes CIFS mount checks when uploads run in parallel
+        self._mount_lock = threading.Lock()
+        # Verified CIFS mount points, mapped to whether this manager mounted them
+        self._mounted_points: Dict[str, bool] = {}
+        # Operations currently using each mount point, and shares to unmount once unused
+        self._cifs_mounts: Dict[str, int] = {}
+        self._unmount_when_idle = set()
+        # Leave shares mounted by listing/cleanup/download until close() instead of
+        # mounting and unmounting around every operation
+        self.cifs_lazy_unmount = bool(self._cifs_config.get('lazy_unmount', True))
+        # mount.cifs credentials file, created once and kept until close()
+        self._creds_lock = threading.Lock()
+        self._cifs_creds: Optional[Tuple[str, Tuple[int, ...]]] = None
+        # Removes the credentials file on release, garbage collection or exit
+        self._creds_finalizer: Optional[weakref.finalize] = None
+        # Nesting depth of session() blocks; shares stay mounted while it is non-zero
+        self._session_depth = 0
+        
+        # Idle FTP/WebDAV connections kept for reuse, with their last-used time
+        self._pool_lock = threading.Lock()
+        self._ftp_pool: List[Tuple[ftplib.FTP, float]] = []
+        self._webdav_pool: List[Tuple[Client, float]] = []
+        
+        # Optional cap on simultaneous FTP sessions (servers limit them per user/IP)
+        max_connections = self._numeric_setting(self._ftp_config, 'max_connections', None, int)
+        self._ftp_slots = (threading.BoundedSemaphore(max_connections)
+                           if max_connections and max_connections > 0 else None)
+        # Whether the FTP server accepts REST before STOR, detected on first use
+        self._ftp_rest_stream: Optional[bool] = None
+        # Opt-in deflate transfer mode; cleared once the server refuses MODE Z
+        self._ftp_mode_z = bool(self._ftp_config.get('mode_z', False))
+        # Opt-in server-side filtering of WebDAV listings: None until OPTIONS shows
+        # whether the server supports SEARCH, False when disabled or unsupported
+        self._webdav_search: Optional[bool] = None if self._webdav_config.get('search', False) else False
+        
+        # Report a missing WebDAV client at start-up rather than mid-backup
+        if self.enabled and self.storage_type == 'webdav' and Client is None:
+            self.logger.warning("WebDAV storage is configured but webdavclient3 is not installed")
+        
+        # Log out of pooled sessions and unmount owned shares even when the caller
+        # never calls close(): on garbage collection or at interpreter exit
+        self._resources = (self._pool_lock, self._ftp_pool, self._webdav_pool,
+                           self._mount_lock, self._mounted_points, self.logger)
+        self._finalizer = weakref.finalize(self, _release_remote_resources, *self._resources)
+        
+        if self.enabled and (prewarm or self.remote_config.get('prewarm', False)):
+            threading.Thread(target=asyncio.run, args=(self.warmup(),),
+                             name='remote-storage-warmup', daemon=True).start()
+        
+    def _numeric_setting(self, section: Dict, key: str, default, convert):
+        """Read a numeric setting, warning and using the default when it is malformed"""
+        value = section.get(key)
+        if value is None:
+            return default
+        try:
+            return convert(value)
+        except (TypeError, ValueError):
+            self.logger.warning("Invalid remote storage setting %s: %r, using the default", key, value)
+            return default
+    
     def is_enabled(self) -> bool:
         """Check if remote storage is enabled"""
         return self.remote_config.get('enabled', False)
@@ -42,51 +391,145 @@ class RemoteStorageManager:
         
         try:
             if self.storage_type == 'webdav':
-                return self._upload_to_webdav(local_file_path, remote_filename)
+                upload = self._upload_to_webdav
             elif self.storage_type == 'cifs':
-                return self._upload_to_cifs(local_file_path, remote_filename)
+                upload = self._upload_to_cifs
             elif self.storage_type == 'ftp':
-                return self._upload_to_ftp(local_file_path, remote_filename)
+                upload = self._upload_to_ftp
             else:
                 raise ValueError(f"Unsupported storage type: {self.storage_type}")
+            
+            if not self.skip_unchanged:
+                return upload(local_file_path, remote_filename)
+            
+            digest = _file_digest(local_file_path)
+            if self._remote_digest(remote_filename, os.path.getsize(local_file_path)) == digest:
+                self.logger.info("Skipped %s, the remote copy is unchanged", remote_filename)
+                return True
+            if not upload(local_file_path, remote_filename):
+                return False
+            try:
+                self._write_remote_digest(remote_filename, digest)
+            except Exception as e:
+                # The backup itself is uploaded, it is just sent again next time
+                self.logger.warning("Could not store digest for %s: %s", remote_filename, e)
+            return True
         except Exception as e:
-            print(f"Remote storage upload error: {e}")
+            self.logger.error("Remote storage upload error: %s", e)
             return False
+        finally:
+            self._listing_cache.pop(self.storage_type, None)
     
-    def _upload_to_webdav(self, local_file_path: str, remote_filename: str) -> bool:
-        """Upload file to WebDAV server"""
-        webdav_config = self.remote_config.get('webdav', {})
+    def upload_backups(self, pairs: List[Tuple[str, str]], max_workers: int = 4) -> List[bool]:
+        """
+        Upload several backup files to remote storage in parallel
         
-        if not webdav_config:
-            raise ValueError("WebDAV configuration not found")
+        Args:
+            pairs: List of (local_file_path, remote_filename) tuples
+            max_workers: Maximum number of concurrent uploads
         
-        # WebDAV client configuration
-        options = {
-            'webdav_hostname': webdav_config.get('url'),
-            'webdav_login': webdav_config.get('username'),
-            'webdav_password': webdav_config.get('password'),
-            'webdav_verify_ssl': webdav_config.get('verify_ssl', True)
-        }
+        Returns:
+            Upload results in the same order as pairs
+        """
+        if len(pairs) <= 1 or max_workers <= 1:
+            return [self.upload_backup(local, remote) for local, remote in pairs]
         
+        # Pooled FTP/WebDAV connections are borrowed by one worker at a time
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            return list(executor.map(lambda pair: self.upload_backup(*pair), pairs))
+    
+    def _remote_digest(self, remote_filename: str, size: int) -> Optional[str]:
+        """Return the stored digest of a remote backup, or None if it is missing or has another size"""
+        sidecar = remote_filename + _DIGEST_SUFFIX
+        buffer = io.BytesIO()
+        # A missing file is caught inside the with blocks so the pooled connection is kept
         try:
-            client = Client(options)
+            if self.storage_type == 'webdav':
+                with self._webdav_connection() as client:
+                    try:
+                        if int(client.info(remote_filename).get('size') or -1) != size:
+                            return None
+                        client.download_from(buffer, sidecar)
+                    except RemoteResourceNotFound:
+                        return None
+            elif self.storage_type == 'ftp':
+                with self._ftp_connection() as ftp:
+                    ftp.voidcmd('TYPE I')
+                    try:
+                        if ftp.size(remote_filename) != size:
+                            return None
+                        ftp.retrbinary(f'RETR {sidecar}', buffer.write)
+                    except ftplib.error_perm:
+                        return None
+            else:
+                with self._cifs_files() as (path_of, open_file, stat):
+                    if stat(path_of(remote_filename)).st_size != size:
+                        return None
+                    with open_file(path_of(sidecar), 'rb') as file:
+                        buffer.write(file.read())
+        except Exception as e:
+            # Not being able to tell only costs the upload that follows
+            self.logger.debug("Could not check remote copy of %s: %s", remote_filename, e)
+            return None
+        return buffer.getvalue().decode('ascii', 'replace').strip()
+    
+    def _write_remote_digest(self, remote_filename: str, digest: str):
+        """Store the digest sidecar next to an uploaded backup"""
+        sidecar = remote_filename + _DIGEST_SUFFIX
+        content = f"{digest}\n".encode('ascii')
+        if self.storage_type == 'webdav':
+            with self._webdav_connection() as client:
+                client.upload_to(content, sidecar)
+        elif self.storage_type == 'ftp':
+            with self._ftp_connection() as ftp:
+                ftp.storbinary(f'STOR {sidecar}', io.BytesIO(content))
+        else:
+            with self._cifs_files() as (path_of, open_file, _):
+                with open_file(path_of(sidecar), 'wb') as file:
+                    file.write(content)
+    
+    def _upload_to_webdav(self, local_file_path: str, remote_filename: str) -> bool:
+        """Upload file to WebDAV server"""
+        try:
+            self._put_webdav_file(local_file_path, remote_filename)
+            self.logger.info("Successfully uploaded %s to WebDAV server", remote_filename)
+            return True
             
+        except Exception as e:
+            self.logger.error("WebDAV upload error: %s", e)
+            return False
+    
+    @_retry_on_disconnect
+    def _put_webdav_file(self, local_file_path: str, remote_filename: str):
+        """Upload file over a pooled WebDAV client"""
+        with self._webdav_connection() as client:
             # Test connection
             if not client.check():
                 raise ConnectionError("Cannot connect to WebDAV server")
             
             # Upload file
-            client.upload_sync(remote_path=remote_filename, local_path=local_file_path)
-            print(f"Successfully uploaded {remote_filename} to WebDAV server")
-            return True
-            
-        except Exception as e:
-            print(f"WebDAV upload error: {e}")
-            return False
+            if os.path.getsize(local_file_path) >= _WEBDAV_STREAM_THRESHOLD:
+                self._stream_to_webdav(client, self._webdav_config,
+                                       local_file_path, remote_filename)
+            else:
+                client.upload_sync(remote_path=remote_filename, local_path=local_file_path)
+    
+    def _stream_to_webdav(self, client: Client, webdav_config: Dict,
+                          local_file_path: str, remote_filename: str):
+        """Stream a large file to WebDAV with a PUT request in 1 MiB chunks"""
+        url = f"{webdav_config.get('url', '').rstrip('/')}/{quote(remote_filename.lstrip('/'))}"
+        response = client.session.put(
+            url,
+            data=_FileChunks(local_file_path),
+            auth=(webdav_config.get('username'), webdav_config.get('password')),
+            verify=webdav_config.get('verify_ssl', True),
+            timeout=client.timeout
+        )
+        response.raise_for_status()
     
     def _upload_to_cifs(self, local_file_path: str, remote_filename: str) -> bool:
         """Upload file to CIFS/Samba server"""
-        cifs_config = self.remote_config.get('cifs', {})
+        cifs_config = self._cifs_config
         
         if not cifs_config:
             raise ValueError("CIFS configuration not found")
@@ -94,42 +537,400 @@ class RemoteStorageManager:
         server = cifs_config.get('server')
         username = cifs_config.get('username')
         password = cifs_config.get('password')
-        mount_point = cifs_config.get('mount_point', '/mnt/backup_storage')
-        auto_mount = cifs_config.get('auto_mount', True)
         
         if not server or not username or not password:
             raise ValueError("CIFS server, username, and password are required")
         
+        # Prefer a direct SMB2 connection, mounting needs root and a kernel round trip
+        transport = cifs_config.get('transport', 'auto')
+        if transport == 'smb' or (transport == 'auto' and smbclient is not None):
+            try:
+                self._upload_via_smb(server, username, password, local_file_path, remote_filename)
+                self.logger.info("Successfully uploaded %s to CIFS server", remote_filename)
+                return True
+            except Exception as e:
+                self.logger.error("CIFS upload error: %s", e)
+                return False
+        
         try:
-            # Create mount point if it doesn't exist
-            os.makedirs(mount_point, exist_ok=True)
-            
-            # Mount CIFS share if auto_mount is enabled
-            if auto_mount:
-                # Check if already mounted
-                if not os.path.ismount(mount_point):
-                    self._mount_cifs_share(server, username, password, mount_point)
-                else:
-                    print(f"CIFS share already mounted at {mount_point}")
+            # Uploads keep the share mounted for the next one, close() unmounts it
+            with self._cifs_mount(cifs_config, keep=True) as mount_point:
+                # Copy file to CIFS share
+                remote_path = os.path.join(mount_point, remote_filename)
+                self._copy_file(local_file_path, remote_path)
             
-            # Check if mount point is accessible
-            if not os.path.ismount(mount_point):
-                raise ConnectionError(f"CIFS share not mounted at {mount_point}")
-            
-            # Copy file to CIFS share
-            remote_path = os.path.join(mount_point, remote_filename)
-            shutil.copy2(local_file_path, remote_path)
-            
-            print(f"Successfully uploaded {remote_filename} to CIFS server")
+            self.logger.info("Successfully uploaded %s to CIFS server", remote_filename)
             return True
             
         except Exception as e:
-            print(f"CIFS upload error: {e}")
+            self.logger.error("CIFS upload error: %s", e)
             return False
     
+    @contextmanager
+    def _cifs_mount(self, cifs_config: Dict, keep: bool = False):
+        """
+        Make the CIFS share available at its mount point for one operation
+        
+        With lazy_unmount disabled, a share mounted here is unmounted once the
+        last operation using it ends, unless keep is set or a session() is
+        active. Otherwise, and for shares kept mounted, close() unmounts it.
+        """
+        mount_point = cifs_config.get('mount_point', '/mnt/backup_storage')
+        auto_mount = cifs_config.get('auto_mount', True)
+        
+        mounted_here = False
+        with self._mount_lock:
+            # Share verified by an earlier operation: skip mkdir and the mount call, but
+            # still stat it once, the share may have been unmounted outside this manager
+            if mount_point in self._mounted_points and not os.path.ismount(mount_point):
+                self.logger.warning("CIFS share at %s is no longer mounted", mount_point)
+                self._mounted_points.pop(mount_point)
+            if mount_point not in self._mounted_points:
+                # Create mount point if it doesn't exist
+                os.makedirs(mount_point, exist_ok=True)
+                
+                # Mount CIFS share if auto_mount is enabled
+                if auto_mount:
+                    # Check if already mounted
+                    if not os.path.ismount(mount_point):
+                        self._mount_cifs_share(cifs_config.get('server'), cifs_config.get('username'),
+                                               cifs_config.get('password'), mount_point)
+                        mounted_here = True
+                    else:
+                        self.logger.debug("CIFS share already mounted at %s", mount_point)
+                
+                # Check if mount point is accessible
+                if not os.path.ismount(mount_point):
+                    raise ConnectionError(f"CIFS share not mounted at {mount_point}")
+                self._mounted_points.setdefault(mount_point, False)
+            self._cifs_mounts[mount_point] = self._cifs_mounts.get(mount_point, 0) + 1
+        
+        try:
+            yield mount_point
+        finally:
+            with self._mount_lock:
+                users = self._cifs_mounts[mount_point] - 1
+                self._cifs_mounts[mount_point] = users
+                if mounted_here and not (keep or self.cifs_lazy_unmount or self._session_depth):
+                    self._unmount_when_idle.add(mount_point)
+                # Parallel operations may still be using the share, the last one unmounts it
+                if not users and mount_point in self._unmount_when_idle:
+                    self._unmount_when_idle.discard(mount_point)
+                    self._unmount_cifs_share(mount_point)
+    
+    @contextmanager
+    def session(self):
+        """
+        Keep remote connections and CIFS mounts open across several operations
+        
+        Example:
+            with storage.session():
+                storage.upload_backup(path, name)
+                storage.cleanup_old_backups(30)
+        
+        FTP and WebDAV connections are reused through the connection pools and
+        a CIFS share is mounted at most once; everything is released when the
+        outermost session ends.
+        """
+        self._session_depth += 1
+        try:
+            yield self
+        finally:
+            self._session_depth -= 1
+            if not self._session_depth:
+                self.close()
+    
+    def _upload_via_smb(self, server: str, username: str, password: str,
+                        local_file_path: str, remote_filename: str):
+        """Upload file over SMB2 with smbprotocol, without mounting the share"""
+        if smbclient is None:
+            raise RuntimeError("CIFS transport 'smb' requires the smbprotocol package")
+        
+        remote_path = self._smb_path(server, username, password, remote_filename)
+        with smbclient.open_file(remote_path, mode='wb') as remote_file:
+            for chunk in _FileChunks(local_file_path):
+                remote_file.write(chunk)
+    
+    def _smb_path(self, server: str, username: str, password: str, remote_filename: str) -> str:
+        """Register an SMB2 session for the share and return the UNC path of a file on it"""
+        # //server/share/dir -> \\server\share\dir
+        share_path = server.replace('/', '\\').strip('\\')
+        host = share_path.split('\\', 1)[0]
+        
+        # Sessions are cached by smbclient, later uploads reuse the connection
+        smbclient.register_session(host, username=username, password=password)
+        
+        return f"\\\\{share_path}\\{remote_filename}"
+    
+    @contextmanager
+    def _cifs_files(self):
+        """Yield (path_of, open, stat) for files on the share over the transport uploads use"""
+        cifs_config = self._cifs_config
+        transport = cifs_config.get('transport', 'auto')
+        if transport == 'smb' or (transport == 'auto' and smbclient is not None):
+            server = cifs_config.get('server')
+            username = cifs_config.get('username')
+            password = cifs_config.get('password')
+            yield ((lambda name: self._smb_path(server, username, password, name)),
+                   (lambda path, mode: smbclient.open_file(path, mode=mode)),
+                   smbclient.stat)
+            return
+        
+        with self._cifs_mount(cifs_config, keep=True) as mount_point:
+            yield (lambda name: os.path.join(mount_point, name)), open, os.stat
+    
+    def _copy_file(self, src_path: str, dst_path: str):
+        """Copy file inside the kernel, falling back to a buffered userspace copy"""
+        with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+            src_fd = src.fileno()
+            dst_fd = dst.fileno()
+            size = os.fstat(src_fd).st_size
+            
+            # Read front to back: let the kernel read ahead aggressively, which
+            # hides per-request latency when the source is on a CIFS share
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
+            copied = False
+            for copy_chunk in _KERNEL_COPIES:
+                offset = 0
+                try:
+                    while True:
+                        sent = copy_chunk(src_fd, dst_fd, offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                except OSError as e:
+                    # Some CIFS mounts and non-Linux systems reject file-to-file copies
+                    if e.errno not in _SENDFILE_UNSUPPORTED:
+                        raise
+                if offset == size:
+                    copied = True
+                    break
+                # Start over with the next method
+                dst.truncate(0)
+            
+            if not copied:
+                src.seek(0)
+                dst.seek(0)
+                shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+            
+            # The file is not read again, drop it from the page cache
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        
+        # Preserve modification time like shutil.copy2
+        shutil.copystat(src_path, dst_path)
+    
     def _upload_to_ftp(self, local_file_path: str, remote_filename: str) -> bool:
         """Upload file to FTP server"""
-        ftp_config = self.remote_config.get('ftp', {})
+        ftp_config = self._ftp_config
+        
+        try:
+            # Inside the try so a malformed setting fails the upload instead of raising
+            streams = int(ftp_config.get('parallel_streams', 1))
+            # YAML may give a fraction (1.5) for the threshold
+            threshold = int(float(ftp_config.get('parallel_threshold_mb', _FTP_PARALLEL_THRESHOLD_MB)) * (1 << 20))
+            # Once the server is known not to take REST + STOR streams, go straight
+            # to the single-stream upload
+            if (streams > 1 and self._ftp_rest_stream is not False
+                    and os.path.getsize(local_file_path) >= threshold):
+                # Large file on a high-latency link: split it across several connections
+                try:
+                    uploaded = self._store_ftp_file_parallel(local_file_path, remote_filename, streams)
+                except Exception as e:
+                    self.logger.warning("Parallel FTP upload of %s failed: %s", remote_filename, e)
+                    uploaded = False
+                if not uploaded:
+                    # The cause was logged as a warning already
+                    self.logger.info("Uploading %s over a single FTP stream", remote_filename)
+                    self._store_ftp_file(local_file_path, remote_filename)
+            else:
+                self._store_ftp_file(local_file_path, remote_filename)
+            self.logger.info("Successfully uploaded %s to FTP server", remote_filename)
+            return True
+            
+        except Exception as e:
+            self.logger.error("FTP upload error: %s", e)
+            return False
+    
+    @_retry_on_disconnect
+    def _store_ftp_file(self, local_file_path: str, remote_filename: str):
+        """Upload file over a pooled FTP connection"""
+        with self._ftp_connection() as ftp:
+            compress = self._enter_mode_z(ftp, remote_filename)
+            self._stor_file(ftp, f'STOR {remote_filename}', local_file_path, compress=compress)
+            if compress:
+                # Pooled connections are shared with listings, which expect stream mode
+                ftp.voidcmd('MODE S')
+    
+    def _enter_mode_z(self, ftp: ftplib.FTP, remote_filename: str) -> bool:
+        """Switch a connection to MODE Z for a transfer worth compressing"""
+        if not self._ftp_mode_z or remote_filename.endswith(_COMPRESSED_SUFFIXES):
+            return False
+        
+        try:
+            ftp.voidcmd('MODE Z')
+            return True
+        except ftplib.error_perm:
+            self.logger.warning("FTP server does not support MODE Z, transferring uncompressed")
+            self._ftp_mode_z = False
+            return False
+    
+    def _store_ftp_file_parallel(self, local_file_path: str, remote_filename: str,
+                                 streams: int) -> bool:
+        """
+        Upload one file over several FTP connections, each writing its own byte range
+        
+        Every stream after the first sends REST <offset> before STOR, so the
+        server writes its range in place. Returns False when the server cannot
+        do this or the uploaded size does not match, leaving the caller to
+        upload over a single stream.
+        """
+        size = os.path.getsize(local_file_path)
+        
+        with self._ftp_connection() as ftp:
+            if not self._supports_rest_stream(ftp):
+                return False
+            
+            # Extra connections are only taken when a session slot is free right now;
+            # waiting for one while holding another could deadlock parallel uploads
+            extra = streams - 1
+            reserved = 0
+            if self._ftp_slots is not None:
+                while reserved < extra and self._ftp_slots.acquire(blocking=False):
+                    reserved += 1
+                extra = reserved
+            
+            try:
+                if extra < 1:
+                    return False
+                
+                part = -(-size // (extra + 1))
+                ranges = [(offset, min(part, size - offset)) for offset in range(0, size, part)]
+                
+                with ThreadPoolExecutor(max_workers=len(ranges) - 1) as executor:
+                    ftp.voidcmd('TYPE I')
+                    # STOR of the first range creates (truncates) the file, the other
+                    # streams may only start writing into it after that
+                    with ftp.transfercmd(f'STOR {remote_filename}') as conn:
+                        futures = [executor.submit(self._store_ftp_range, local_file_path,
+                                                   remote_filename, offset, length)
+                                   for offset, length in ranges[1:]]
+                        self._send_data(conn, local_file_path, 0, ranges[0][1])
+                    ftp.voidresp()
+                    try:
+                        for future in futures:
+                            future.result()
+                    except ftplib.error_perm:
+                        # Many servers refuse REST beyond the current end of file,
+                        # do not try parallel streams against this one again
+                        self._ftp_rest_stream = False
+                        self.logger.warning("FTP server refuses REST beyond the end of file, "
+                                            "parallel streams disabled")
+                        raise
+            finally:
+                for _ in range(reserved):
+                    self._ftp_slots.release()
+            
+            ftp.voidcmd('TYPE I')
+            remote_size = ftp.size(remote_filename)
+            if remote_size != size:
+                self.logger.warning("Parallel FTP upload of %s has %s of %s bytes",
+                                    remote_filename, remote_size, size)
+                return False
+            return True
+    
+    def _store_ftp_range(self, local_file_path: str, remote_filename: str, offset: int, length: int):
+        """Upload one byte range of a file over its own pooled FTP connection"""
+        # The session slot was reserved by the caller
+        with self._pooled_ftp_connection() as ftp:
+            self._stor_file(ftp, f'STOR {remote_filename}', local_file_path, offset, length)
+    
+    def _supports_rest_stream(self, ftp: ftplib.FTP) -> bool:
+        """Check once whether the FTP server advertises REST STREAM"""
+        if self._ftp_rest_stream is None:
+            try:
+                self._ftp_rest_stream = 'REST STREAM' in ftp.sendcmd('FEAT').upper()
+            except ftplib.error_perm:
+                self._ftp_rest_stream = False
+            if not self._ftp_rest_stream:
+                self.logger.warning("FTP server does not advertise REST STREAM, "
+                                    "parallel streams disabled")
+        return self._ftp_rest_stream
+    
+    def _stor_file(self, ftp: ftplib.FTP, cmd: str, local_file_path: str,
+                   offset: int = 0, length: Optional[int] = None, compress: bool = False) -> str:
+        """Send a file, or a byte range of it, over an FTP data connection"""
+        ftp.voidcmd('TYPE I')
+        with ftp.transfercmd(cmd, rest=offset or None) as conn:
+            self._send_data(conn, local_file_path, offset, length, compress)
+        return ftp.voidresp()
+    
+    def _send_data(self, conn: socket.socket, local_file_path: str,
+                   offset: int = 0, length: Optional[int] = None, compress: bool = False):
+        """Send file contents on a data connection from one reusable buffer, deflated in MODE Z"""
+        # Same steps as storbinary(), but readinto() a single bytearray
+        # instead of allocating a new bytes object for every block
+        buf = bytearray(_TRANSFER_BLOCK_SIZE)
+        view = memoryview(buf)
+        try:
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _DATA_SOCKET_BUFFER)
+        except OSError:
+            pass  # Not fatal, keep the system defaults
+        
+        compressor = zlib.compressobj() if compress else None
+        remaining = os.path.getsize(local_file_path) - offset if length is None else length
+        with open(local_file_path, 'rb', buffering=0) as file:
+            file.seek(offset)
+            while remaining > 0:
+                n = file.readinto(view[:min(remaining, _TRANSFER_BLOCK_SIZE)])
+                if not n:
+                    break
+                if compressor is None:
+                    conn.sendall(view[:n])
+                else:
+                    conn.sendall(compressor.compress(view[:n]))
+                remaining -= n
+        if compressor is not None:
+            conn.sendall(compressor.flush())
+        # Shut down TLS cleanly so the server sees a complete transfer
+        unwrap = getattr(conn, 'unwrap', None)
+        if unwrap is not None:
+            unwrap()
+    
+    def _retr_file(self, ftp: ftplib.FTP, cmd: str, local_path: str, decompress: bool = False) -> str:
+        """Receive a file over an FTP data connection into one reusable buffer, inflated in MODE Z"""
+        # Counterpart of _stor_file: retrbinary() reads 8 KiB blocks into new bytes objects
+        buf = bytearray(_TRANSFER_BLOCK_SIZE)
+        view = memoryview(buf)
+        decompressor = zlib.decompressobj() if decompress else None
+        ftp.voidcmd('TYPE I')
+        with ftp.transfercmd(cmd) as conn:
+            try:
+                conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _DATA_SOCKET_BUFFER)
+            except OSError:
+                pass  # Not fatal, keep the system defaults
+            with open(local_path, 'wb') as file:
+                while True:
+                    n = conn.recv_into(buf)
+                    if not n:
+                        break
+                    if decompressor is None:
+                        file.write(view[:n])
+                    else:
+                        file.write(decompressor.decompress(view[:n]))
+                if decompressor is not None:
+                    file.write(decompressor.flush())
+            # Shut down TLS cleanly so the server sees a complete transfer
+            unwrap = getattr(conn, 'unwrap', None)
+            if unwrap is not None:
+                unwrap()
+        return ftp.voidresp()
+    
+    def _connect_ftp(self) -> ftplib.FTP:
+        """Open a logged-in FTP connection inside the configured remote directory"""
+        ftp_config = self._ftp_config
         
         if not ftp_config:
             raise ValueError("FTP configuration not found")
@@ -145,104 +946,239 @@ class RemoteStorageManager:
         if not all([host, username, password]):
             raise ValueError("FTP host, username, and password are required")
         
-        try:
-            # Create FTP connection
-            if ssl:
-                ftp = ftplib.FTP_TLS()
-            else:
-                ftp = ftplib.FTP()
-            
-            # Connect to server
-            ftp.connect(host, port)
-            ftp.login(username, password)
-            
-            # Set passive mode
-            if passive_mode:
-                ftp.set_pasv(True)
-            
-            # Change to remote directory
-            if remote_dir and remote_dir != '/':
+        # Create FTP connection
+        if ssl:
+            ftp = _SessionReuseFTP_TLS()
+        else:
+            ftp = ftplib.FTP()
+        
+        # Connect to server
+        ftp.connect(host, port)
+        self._tune_socket(ftp.sock)
+        ftp.login(username, password)
+        if ssl:
+            # Encrypt data connections too, login() only secures the control connection
+            ftp.prot_p()
+        
+        # Set passive mode
+        if passive_mode:
+            ftp.set_pasv(True)
+        
+        # Change to remote directory
+        if remote_dir and remote_dir != '/':
+            try:
+                ftp.cwd(remote_dir)
+            except ftplib.error_perm:
+                # Try to create directory if it doesn't exist
                 try:
+                    ftp.mkd(remote_dir)
                     ftp.cwd(remote_dir)
-                except ftplib.error_perm:
-                    # Try to create directory if it doesn't exist
-                    try:
-                        ftp.mkd(remote_dir)
-                        ftp.cwd(remote_dir)
-                    except ftplib.error_perm:
-                        print(f"Warning: Could not create or access directory {remote_dir}")
-            
-            # Upload file
-            with open(local_file_path, 'rb') as file:
-                ftp.storbinary(f'STOR {remote_filename}', file)
-            
-            # Close connection
-            ftp.quit()
-            
-            print(f"Successfully uploaded {remote_filename} to FTP server")
-            return True
-            
-        except Exception as e:
-            print(f"FTP upload error: {e}")
-            return False
-        finally:
-            # Unmount CIFS share if auto_mount is enabled
-            if auto_mount:
-                self._unmount_cifs_share(mount_point)
+                except ftplib.error_perm as e:
+                    # Never fall back to the login directory, cleanup would delete from it
+                    ftp.close()
+                    raise ftplib.error_perm(f"Could not create or access directory {remote_dir}: {e}") from e
+        
+        return ftp
+    
+    def _connect_webdav(self) -> Client:
+        """Create a WebDAV client from configuration"""
+        webdav_config = self._webdav_config
+        
+        if not webdav_config:
+            raise ValueError("WebDAV configuration not found")
+        if Client is None:
+            raise RuntimeError("WebDAV storage requires the webdavclient3 package")
+        
+        client = Client(self._webdav_options)
+        # webdav3 has no verify option, certificate checks are a client attribute
+        client.verify = webdav_config.get('verify_ssl', True)
+        
+        # Keep TCP/TLS connections alive across requests made through this client
+        adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+        client.session.mount('http://', adapter)
+        client.session.mount('https://', adapter)
+        client.session.hooks['response'].append(_release_response)
+        return client
+    
+    def _checkout(self, pool: List[Tuple[object, float]]) -> Tuple[Optional[object], float, List[object]]:
+        """Take the most recently used idle connection from a pool, its idle time and any expired ones"""
+        now = time.monotonic()
+        with self._pool_lock:
+            expired = [conn for conn, last_used in pool if now - last_used > _POOL_IDLE_TIMEOUT]
+            if expired:
+                pool[:] = [item for item in pool if now - item[1] <= _POOL_IDLE_TIMEOUT]
+            conn, last_used = pool.pop() if pool else (None, now)
+        return conn, now - last_used, expired
+    
+    @contextmanager
+    def _ftp_connection(self):
+        """Borrow an FTP connection, waiting for a free session slot when they are capped"""
+        if self._ftp_slots is None:
+            with self._pooled_ftp_connection() as ftp:
+                yield ftp
+            return
+        
+        # Only checked-out connections enter the pool, so the pool never exceeds the cap either
+        with self._ftp_slots:
+            with self._pooled_ftp_connection() as ftp:
+                yield ftp
+    
+    @contextmanager
+    def _pooled_ftp_connection(self):
+        """Borrow an FTP connection from the pool, connecting when none is idle"""
+        ftp, idle, expired = self._checkout(self._ftp_pool)
+        for stale in expired:
+            stale.close()
+        if ftp is not None and idle > _FTP_NOOP_AFTER:
+            # The server may have dropped an idle session; reconnect rather than fail mid-operation
+            try:
+                ftp.voidcmd('NOOP')
+            except ftplib.all_errors:
+                ftp.close()
+                ftp = None
+        if ftp is None:
+            ftp = self._connect_ftp()
+        
+        try:
+            yield ftp
+        except Exception:
+            # Connection state is unknown after a failure, do not reuse it
+            ftp.close()
+            raise
+        
+        with self._pool_lock:
+            self._ftp_pool.append((ftp, time.monotonic()))
+    
+    @contextmanager
+    def _webdav_connection(self):
+        """Borrow a WebDAV client from the pool, creating one when none is idle"""
+        client, _, expired = self._checkout(self._webdav_pool)
+        for stale in expired:
+            stale.session.close()
+        if client is None:
+            client = self._connect_webdav()
+        
+        try:
+            yield client
+        except Exception:
+            client.session.close()
+            raise
+        
+        with self._pool_lock:
+            self._webdav_pool.append((client, time.monotonic()))
+    
+    def close(self):
+        """Close pooled remote storage connections and unmount CIFS shares mounted for uploads"""
+        # The pools and mount table are emptied in place, so the manager stays usable
+        # and its finalizer only has what was opened after this call left to release
+        _release_remote_resources(*self._resources)
+        self._release_cifs_credentials()
+    
+    def _tune_socket(self, sock: socket.socket):
+        """Disable Nagle's algorithm and keep idle pooled control connections alive"""
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Stops NAT/firewall state for an idle pooled connection from being dropped
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass  # Not fatal, keep the system defaults
     
     def _mount_cifs_share(self, server: str, username: str, password: str, mount_point: str):
         """Mount CIFS share"""
         try:
-            # Detect OS and use appropriate mount command
-            import platform
-            system = platform.system().lower()
-            
-            if system == 'darwin':  # macOS
+            # Use the mount command for this OS
+            if _SYSTEM == 'darwin':  # macOS
                 # Use mount_smbfs for macOS
                 mount_cmd = [
                     'mount_smbfs',
                     f'//{username}:{password}@{server.replace("//", "").replace("/", "/")}',
                     mount_point
                 ]
+                result = subprocess.run(mount_cmd, capture_output=True, text=True)
             else:  # Linux
-                # Create credentials file
-                creds_file = tempfile.NamedTemporaryFile(mode='w', delete=False)
-                creds_file.write(f"username={username}\n")
-                creds_file.write(f"password={password}\n")
-                creds_file.close()
-                
+                creds_path, pass_fds = self._cifs_credentials(username, password)
+                options = {**_CIFS_MOUNT_OPTIONS, **(self._cifs_config.get('mount_options') or {})}
+                option_list = [f'credentials={creds_path}', f'uid={os.getuid()}', f'gid={os.getgid()}']
+                for name, value in options.items():
+                    if value is True:
+                        option_list.append(name)
+                    elif value is not None and value is not False:
+                        option_list.append(f'{name}={value}')
                 # Mount command for Linux
                 mount_cmd = [
                     'mount', '-t', 'cifs', server, mount_point,
-                    '-o', f'credentials={creds_file.name},uid={os.getuid()},gid={os.getgid()}'
+                    '-o', ','.join(option_list)
                 ]
+                result = subprocess.run(mount_cmd, capture_output=True, text=True,
+                                        pass_fds=pass_fds)
             
-            # Execute mount
-            result = subprocess.run(mount_cmd, capture_output=True, text=True)
+            # Check mount result
             if result.returncode != 0:
                 raise RuntimeError(f"Failed to mount CIFS share: {result.stderr}")
             
-            print(f"CIFS share mounted at {mount_point}")
+            self._mounted_points[mount_point] = True
+            self.logger.info("CIFS share mounted at %s", mount_point)
             
         except Exception as e:
-            print(f"Error mounting CIFS share: {e}")
+            self.logger.error("Error mounting CIFS share: %s", e)
             raise
-        finally:
-            # Clean up credentials file (Linux only)
-            if system != 'darwin' and 'creds_file' in locals():
+    
+    def _cifs_credentials(self, username: str, password: str) -> Tuple[str, Tuple[int, ...]]:
+        """
+        Provide the mount.cifs credentials file, creating it on first use
+        
+        Returns the credentials path and the file descriptors the mount process
+        must inherit. Where O_TMPFILE is supported the file has no name on disk
+        and is read through /proc/self/fd; otherwise a private temporary file
+        is used. Either way it lives until close(), interpreter exit or garbage
+        collection of the manager.
+        """
+        with self._creds_lock:
+            if self._cifs_creds is not None:
+                return self._cifs_creds
+            
+            content = f"username={username}\npassword={password}\n".encode('utf-8')
+            
+            fd = None
+            if hasattr(os, 'O_TMPFILE'):
+                try:
+                    fd = os.open(tempfile.gettempdir(), os.O_TMPFILE | os.O_WRONLY, 0o600)
+                except OSError:
+                    fd = None  # Filesystem without O_TMPFILE support
+            
+            if fd is not None:
                 try:
-                    os.unlink(creds_file.name)
-                except:
-                    pass
+                    os.write(fd, content)
+                    os.fsync(fd)
+                except OSError:
+                    os.close(fd)
+                    raise
+                self._cifs_creds = (f"/proc/self/fd/{fd}", (fd,))
+            else:
+                # mkstemp creates the file readable by the current user only
+                fd, creds_path = tempfile.mkstemp()
+                try:
+                    os.write(fd, content)
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                self._cifs_creds = (creds_path, ())
+            
+            self._creds_finalizer = weakref.finalize(self, _remove_cifs_credentials, self._cifs_creds)
+            return self._cifs_creds
+    
+    def _release_cifs_credentials(self):
+        """Close or remove the cached mount.cifs credentials file"""
+        with self._creds_lock:
+            finalizer, self._creds_finalizer = self._creds_finalizer, None
+            self._cifs_creds = None
+        if finalizer is not None:
+            finalizer()  # Runs _remove_cifs_credentials at most once
     
     def _unmount_cifs_share(self, mount_point: str):
         """Unmount CIFS share"""
-        try:
-            if os.path.ismount(mount_point):
-                subprocess.run(['umount', mount_point], check=True)
-                print(f"CIFS share unmounted from {mount_point}")
-        except Exception as e:
-            print(f"Error unmounting CIFS share: {e}")
+        self._mounted_points.pop(mount_point, None)
+        _unmount_share(mount_point, self.logger)
     
     def test_connection(self) -> bool:
         """Test connection to remote storage"""
@@ -259,34 +1195,29 @@ class RemoteStorageManager:
             else:
                 return False
         except Exception as e:
-            print(f"Remote storage connection test failed: {e}")
+            self.logger.warning("Remote storage connection test failed: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False
     
     def _test_webdav_connection(self) -> bool:
         """Test WebDAV connection"""
-        webdav_config = self.remote_config.get('webdav', {})
+        webdav_config = self._webdav_config
         
         if not webdav_config:
             return False
         
         try:
-            options = {
-                'webdav_hostname': webdav_config.get('url'),
-                'webdav_login': webdav_config.get('username'),
-                'webdav_password': webdav_config.get('password'),
-                'webdav_verify_ssl': webdav_config.get('verify_ssl', True)
-            }
-            
-            client = Client(options)
-            return client.check()
+            with self._webdav_connection() as client:
+                return client.check()
             
         except Exception as e:
-            print(f"WebDAV connection test failed: {e}")
+            self.logger.warning("WebDAV connection test failed: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False
     
     def _test_cifs_connection(self) -> bool:
         """Test CIFS connection"""
-        cifs_config = self.remote_config.get('cifs', {})
+        cifs_config = self._cifs_config
         
         if not cifs_config:
             return False
@@ -303,31 +1234,25 @@ class RemoteStorageManager:
             # Create temporary mount point
             temp_mount = tempfile.mkdtemp()
             
-            # Detect OS and use appropriate mount command
-            import platform
-            system = platform.system().lower()
-            
-            if system == 'darwin':  # macOS
+            # Use the mount command for this OS
+            if _SYSTEM == 'darwin':  # macOS
                 # Use mount_smbfs for macOS
                 mount_cmd = [
                     'mount_smbfs',
                     f'//{username}:{password}@{server.replace("//", "").replace("/", "/")}',
                     temp_mount
                 ]
+                result = subprocess.run(mount_cmd, capture_output=True, text=True)
             else:  # Linux
-                # Create credentials file
-                creds_file = tempfile.NamedTemporaryFile(mode='w', delete=False)
-                creds_file.write(f"username={username}\n")
-                creds_file.write(f"password={password}\n")
-                creds_file.close()
-                
+                creds_path, pass_fds = self._cifs_credentials(username, password)
                 # Test mount for Linux
                 mount_cmd = [
                     'mount', '-t', 'cifs', server, temp_mount,
-                    '-o', f'credentials={creds_file.name},uid={os.getuid()},gid={os.getgid()}'
+                    '-o', f'credentials={creds_path},uid={os.getuid()},gid={os.getgid()}'
                 ]
+                result = subprocess.run(mount_cmd, capture_output=True, text=True,
+                                        pass_fds=pass_fds)
             
-            result = subprocess.run(mount_cmd, capture_output=True, text=True)
             success = result.returncode == 0
             
             if success:
@@ -336,62 +1261,35 @@ class RemoteStorageManager:
             
             # Clean up
             os.rmdir(temp_mount)
-            if system != 'darwin' and 'creds_file' in locals():
-                os.unlink(creds_file.name)
             
             return success
             
         except Exception as e:
-            print(f"CIFS connection test failed: {e}")
+            self.logger.warning("CIFS connection test failed: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False
     
     def _test_ftp_connection(self) -> bool:
         """Test FTP connection"""
-        ftp_config = self.remote_config.get('ftp', {})
+        ftp_config = self._ftp_config
         
         if not ftp_config:
             return False
         
-        host = ftp_config.get('host')
-        port = ftp_config.get('port', 21)
-        username = ftp_config.get('username')
-        password = ftp_config.get('password')
-        ssl = ftp_config.get('ssl', False)
-        
-        if not all([host, username, password]):
+        if not all([ftp_config.get('host'), ftp_config.get('username'), ftp_config.get('password')]):
             return False
         
         try:
-            # Create FTP connection
-            if ssl:
-                ftp = ftplib.FTP_TLS()
-            else:
-                ftp = ftplib.FTP()
-            
-            # Test connection
-            ftp.connect(host, port)
-            ftp.login(username, password)
-            
-            # Test directory access
-            remote_dir = ftp_config.get('remote_dir', '/')
-            if remote_dir and remote_dir != '/':
-                try:
-                    ftp.cwd(remote_dir)
-                except ftplib.error_perm:
-                    # Try to create directory if it doesn't exist
-                    try:
-                        ftp.mkd(remote_dir)
-                        ftp.cwd(remote_dir)
-                    except ftplib.error_perm:
-                        pass  # Directory creation failed, but connection is OK
-            
-            # Close connection
-            ftp.quit()
+            # The tested connection goes back to the pool for the upload that follows;
+            # connecting already enters (or creates) the remote directory
+            with self._ftp_connection() as ftp:
+                ftp.voidcmd('NOOP')
             
             return True
             
         except Exception as e:
-            print(f"FTP connection test failed: {e}")
+            self.logger.warning("FTP connection test failed: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False
     
     def cleanup_old_backups(self, retention_days: int) -> Dict[str, int]:
@@ -415,218 +1313,284 @@ class RemoteStorageManager:
             elif self.storage_type == 'ftp':
                 return self._cleanup_ftp_backups(retention_days)
             else:
-                print(f"Cleanup not supported for storage type: {self.storage_type}")
+                self.logger.error("Cleanup not supported for storage type: %s", self.storage_type)
                 return {'deleted': 0, 'kept': 0, 'errors': 0}
         except Exception as e:
-            print(f"Remote storage cleanup error: {e}")
+            self.logger.error("Remote storage cleanup error: %s", e)
             return {'deleted': 0, 'kept': 0, 'errors': 1}
+        finally:
+            self._listing_cache.pop(self.storage_type, None)
     
     def _cleanup_webdav_backups(self, retention_days: int) -> Dict[str, int]:
         """Clean up old backups from WebDAV server"""
-        webdav_config = self.remote_config.get('webdav', {})
+        webdav_config = self._webdav_config
         
         if not webdav_config:
-            print("WebDAV configuration not found")
+            self.logger.error("WebDAV configuration not found")
             return {'deleted': 0, 'kept': 0, 'errors': 1}
         
         try:
-            options = {
-                'webdav_hostname': webdav_config.get('url'),
-                'webdav_login': webdav_config.get('username'),
-                'webdav_password': webdav_config.get('password'),
-                'webdav_verify_ssl': webdav_config.get('verify_ssl', True)
-            }
-            
-            client = Client(options)
-            
-            # Get list of files
-            files = client.list()
-            if not files:
+            with self._webdav_connection() as client:
+                # Get backup files with their modification times
+                backup_files = self._webdav_backup_times(client, webdav_config)
+            if not backup_files:
                 return {'deleted': 0, 'kept': 0, 'errors': 0}
             
-            # Filter backup files
-            backup_files = [f for f in files if f.endswith(('.dump', '.sql', '.gz', '.bz2'))]
-            
             # Calculate cutoff date
-            cutoff_date = datetime.now() - timedelta(days=retention_days)
-            
-            stats = {'deleted': 0, 'kept': 0, 'errors': 0}
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
             
-            for file_path in backup_files:
-                try:
-                    # Get file info (this is a simplified approach)
-                    # In a real implementation, you'd need to get file modification time
-                    # WebDAV doesn't always provide this easily
-                    file_name = os.path.basename(file_path)
-                    
-                    # For now, we'll use a simple filename-based approach
-                    # This is a limitation of the current WebDAV implementation
-                    if self._should_delete_file(file_name, retention_days):
-                        client.delete(file_path)
-                        stats['deleted'] += 1
-                        print(f"Deleted remote file: {file_name}")
-                    else:
-                        stats['kept'] += 1
-                        
-                except Exception as e:
-                    print(f"Error processing file {file_path}: {e}")
-                    stats['errors'] += 1
+            # Files without a known modification time are kept
+            candidates = [name for name, modified in backup_files.items()
+                          if modified is not None and modified < cutoff_date]
             
-            return stats
+            deleted, errors = self._delete_remote_files(candidates, self._delete_webdav_file)
+            return {'deleted': deleted, 'kept': len(backup_files) - len(candidates), 'errors': errors}
             
         except Exception as e:
-            print(f"WebDAV cleanup error: {e}")
+            self.logger.error("WebDAV cleanup error: %s", e)
             return {'deleted': 0, 'kept': 0, 'errors': 1}
     
+    def _webdav_backup_times(self, client: Client, webdav_config: Dict) -> Dict[str, Optional[datetime]]:
+        """Map backup files in the WebDAV directory to their modification times"""
+        # One PROPFIND with Depth: 1 returns the properties of every child,
+        # instead of a list() followed by an info() request per file
+        return {name: _parse_http_time(modified)
+                for name, modified in self._webdav_files(client, webdav_config)
+                if name.endswith(_BACKUP_SUFFIXES)}
+    
+    def _webdav_files(self, client: Client, webdav_config: Dict, search: bool = False):
+        """Yield (name, last-modified header) for the files in the WebDAV directory"""
+        url = f"{webdav_config.get('url', '').rstrip('/')}/"
+        if search:
+            # SEARCH carries its depth in the body and returns only backup files
+            method = 'SEARCH'
+            body = _SEARCH_BODY.format(href=escape(urlsplit(url).path)).encode('utf-8')
+            headers = {'Content-Type': 'text/xml; charset=utf-8'}
+        else:
+            method = 'PROPFIND'
+            body = _PROPFIND_BODY
+            headers = {'Depth': '1', 'Content-Type': 'application/xml; charset=utf-8'}
+        response = client.session.request(
+            method,
+            url,
+            data=body,
+            headers=headers,
+            auth=(webdav_config.get('username'), webdav_config.get('password')),
+            verify=client.verify,
+            timeout=client.timeout,
+            stream=True
+        )
+        with response:
+            response.raise_for_status()
+            # Parse the multistatus body as it arrives and drop each entry once
+            # handled, so large directories are never held as one document
+            response.raw.decode_content = True
+            for _, item in ElementTree.iterparse(response.raw, events=('end',)):
+                if item.tag != '{DAV:}response':
+                    continue
+                href = item.findtext('{DAV:}href')
+                # Collections (the directory itself, subdirectories) are not backups
+                if href and item.find('.//{DAV:}resourcetype/{DAV:}collection') is None:
+                    name = unquote(urlsplit(href).path).rstrip('/').rsplit('/', 1)[-1]
+                    yield name, item.findtext('.//{DAV:}getlastmodified')
+                item.clear()
+    
+    @_retry_on_disconnect
+    def _delete_webdav_file(self, remote_path: str):
+        """Delete a remote file over a pooled WebDAV client"""
+        with self._webdav_connection() as client:
+            # webdav3 names its DELETE method clean()
+            client.clean(remote_path)
+            if self.skip_unchanged:
+                # Caught inside the block so a missing sidecar keeps the client pooled
+                try:
+                    client.clean(remote_path + _DIGEST_SUFFIX)
+                except RemoteResourceNotFound:
+                    pass  # Uploaded before skip_unchanged was enabled
+    
+    def _delete_remote_files(self, remote_paths: List[str], delete_file) -> Tuple[int, int]:
+        """Delete remote files concurrently, returning (deleted, errors) counts"""
+        if not remote_paths:
+            return 0, 0
+        
+        def delete(remote_path: str) -> bool:
+            try:
+                # Also removes the digest sidecar when skip_unchanged is set
+                delete_file(remote_path)
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("Deleted remote file: %s", os.path.basename(remote_path))
+                return True
+            except Exception as e:
+                self.logger.error("Error deleting file %s: %s", remote_path, e)
+                return False
+        
+        # Every delete is a full round trip, so overlap them; each worker
+        # borrows its own pooled connection since clients are not thread-safe
+        deleted = 0
+        errors = 0
+        with ThreadPoolExecutor(max_workers=min(self.delete_workers, len(remote_paths))) as executor:
+            futures = [executor.submit(delete, remote_path) for remote_path in remote_paths]
+            for future in as_completed(futures):
+                if future.result():
+                    deleted += 1
+                else:
+                    errors += 1
+        return deleted, errors
+    
     def _cleanup_cifs_backups(self, retention_days: int) -> Dict[str, int]:
         """Clean up old backups from CIFS/Samba server"""
-        cifs_config = self.remote_config.get('cifs', {})
+        cifs_config = self._cifs_config
         
         if not cifs_config:
-            print("CIFS configuration not found")
+            self.logger.error("CIFS configuration not found")
             return {'deleted': 0, 'kept': 0, 'errors': 1}
         
-        server = cifs_config.get('server')
-        username = cifs_config.get('username')
-        password = cifs_config.get('password')
-        mount_point = cifs_config.get('mount_point', '/mnt/backup_storage')
-        auto_mount = cifs_config.get('auto_mount', True)
-        
         try:
-            # Mount CIFS share if auto_mount is enabled
-            if auto_mount:
-                # Check if already mounted
-                if not os.path.ismount(mount_point):
-                    self._mount_cifs_share(server, username, password, mount_point)
-                else:
-                    print(f"CIFS share already mounted at {mount_point}")
-            
-            # Check if mount point is accessible
-            if not os.path.ismount(mount_point):
-                print(f"CIFS share not mounted at {mount_point}")
-                return {'deleted': 0, 'kept': 0, 'errors': 1}
-            
-            # Get backup files
-            backup_files = []
-            for file_path in Path(mount_point).iterdir():
-                if file_path.is_file() and file_path.suffix in ['.dump', '.sql', '.gz', '.bz2']:
-                    backup_files.append(file_path)
-            
-            # Calculate cutoff date
-            cutoff_date = datetime.now() - timedelta(days=retention_days)
-            
-            stats = {'deleted': 0, 'kept': 0, 'errors': 0}
-            
-            for file_path in backup_files:
-                try:
-                    file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_time < cutoff_date:
-                        file_path.unlink()
-                        stats['deleted'] += 1
-                        print(f"Deleted remote file: {file_path.name}")
-                    else:
-                        stats['kept'] += 1
-                        
-                except Exception as e:
-                    print(f"Error deleting file {file_path.name}: {e}")
-                    stats['errors'] += 1
-            
-            return stats
-            
+            with self._cifs_mount(cifs_config) as mount_point:
+                # Get backup files; scandir returns the file type with each entry,
+                # so the share is not asked for attributes once per file
+                with os.scandir(mount_point) as entries:
+                    backup_files = [entry for entry in entries
+                                    if entry.name.endswith(_BACKUP_SUFFIXES)
+                                    and entry.is_file(follow_symlinks=False)]
+                
+                # Calculate cutoff date
+                cutoff_ts = (datetime.now() - timedelta(days=retention_days)).timestamp()
+                
+                stats = {'deleted': 0, 'kept': 0, 'errors': 0}
+                
+                for entry in backup_files:
+                    try:
+                        if entry.stat(follow_symlinks=False).st_mtime < cutoff_ts:
+                            os.unlink(entry.path)
+                            if self.skip_unchanged:
+                                try:
+                                    os.unlink(entry.path + _DIGEST_SUFFIX)
+                                except FileNotFoundError:
+                                    pass  # Uploaded before skip_unchanged was enabled
+                            stats['deleted'] += 1
+                            self.logger.info("Deleted remote file: %s", entry.name)
+                        else:
+                            stats['kept'] += 1
+                            
+                    except Exception as e:
+                        self.logger.error("Error deleting file %s: %s", entry.name, e)
+                        stats['errors'] += 1
+                
+                return stats
+                
         except Exception as e:
-            print(f"CIFS cleanup error: {e}")
+            self.logger.error("CIFS cleanup error: %s", e)
             return {'deleted': 0, 'kept': 0, 'errors': 1}
-        finally:
-            # Unmount CIFS share if auto_mount is enabled
-            if auto_mount:
-                self._unmount_cifs_share(mount_point)
     
     def _cleanup_ftp_backups(self, retention_days: int) -> Dict[str, int]:
         """Clean up old backups from FTP server"""
-        ftp_config = self.remote_config.get('ftp', {})
+        ftp_config = self._ftp_config
         
         if not ftp_config:
-            print("FTP configuration not found")
+            self.logger.error("FTP configuration not found")
             return {'deleted': 0, 'kept': 0, 'errors': 1}
         
-        host = ftp_config.get('host')
-        port = ftp_config.get('port', 21)
-        username = ftp_config.get('username')
-        password = ftp_config.get('password')
-        remote_dir = ftp_config.get('remote_dir', '/')
-        ssl = ftp_config.get('ssl', False)
-        
         try:
-            # Create FTP connection
-            if ssl:
-                ftp = ftplib.FTP_TLS()
-            else:
-                ftp = ftplib.FTP()
+            # Get backup files with their modification times; the listing connection
+            # returns to the pool and is reused by the deletions
+            with self._ftp_connection() as ftp:
+                backup_files = self._ftp_backup_times(ftp)
             
-            # Connect to server
-            ftp.connect(host, port)
-            ftp.login(username, password)
+            # Calculate cutoff date (FTP times are UTC)
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
             
-            # Change to remote directory
-            if remote_dir and remote_dir != '/':
-                try:
-                    ftp.cwd(remote_dir)
-                except ftplib.error_perm:
-                    print(f"Could not access directory {remote_dir}")
-                    return {'deleted': 0, 'kept': 0, 'errors': 1}
-            
-            # Get list of files
-            files = []
-            ftp.retrlines('LIST', files.append)
-            
-            # Parse files and filter backup files
-            backup_files = []
-            for line in files:
-                parts = line.split()
-                if len(parts) >= 9:
-                    filename = ' '.join(parts[8:])
-                    if filename.endswith(('.dump', '.sql', '.gz', '.bz2')):
-                        backup_files.append(filename)
-            
-            # Calculate cutoff date
-            cutoff_date = datetime.now() - timedelta(days=retention_days)
-            
-            stats = {'deleted': 0, 'kept': 0, 'errors': 0}
-            
-            for filename in backup_files:
-                try:
-                    # Get file modification time (simplified approach)
-                    # FTP doesn't always provide reliable modification time
-                    if self._should_delete_file(filename, retention_days):
-                        ftp.delete(filename)
-                        stats['deleted'] += 1
-                        print(f"Deleted remote file: {filename}")
-                    else:
-                        stats['kept'] += 1
-                        
-                except Exception as e:
-                    print(f"Error deleting file {filename}: {e}")
-                    stats['errors'] += 1
-            
-            # Close connection
-            ftp.quit()
+            # Files without a known modification time are kept
+            candidates = [name for name, modified in backup_files.items()
+                          if modified is not None and modified < cutoff_date]
             
-            return stats
+            deleted, errors = self._delete_remote_files(candidates, self._delete_ftp_file)
+            return {'deleted': deleted, 'kept': len(backup_files) - len(candidates), 'errors': errors}
             
         except Exception as e:
-            print(f"FTP cleanup error: {e}")
+            self.logger.error("FTP cleanup error: %s", e)
             return {'deleted': 0, 'kept': 0, 'errors': 1}
     
-    def _should_delete_file(self, filename: str, retention_days: int) -> bool:
-        """
-        Determine if a file should be deleted based on filename and retention policy
-        This is a simplified approach - in a real implementation, you'd want to
-        parse the actual file modification time from the remote storage
-        """
-        # This is a placeholder implementation
-        # In practice, you'd need to implement proper file age detection
-        # based on the specific remote storage type
-        return False  # Conservative approach - don't delete by default
+    @_retry_on_disconnect
+    def _list_webdav_files(self) -> List[str]:
+        """List the WebDAV directory over a pooled client"""
+        with self._webdav_connection() as client:
+            if self._supports_webdav_search(client):
+                try:
+                    return [name for name, _ in self._webdav_files(client, self._webdav_config, search=True)]
+                except (requests.HTTPError, ElementTree.ParseError) as e:
+                    # Advertised but not usable for this collection, e.g. a different scope syntax
+                    self.logger.warning("WebDAV SEARCH failed, listing with PROPFIND: %s", e)
+                    self._webdav_search = False
+            return [name for name, _ in self._webdav_files(client, self._webdav_config)]
+    
+    def _supports_webdav_search(self, client: Client) -> bool:
+        """Check once whether the WebDAV server accepts RFC 5323 basicsearch"""
+        if self._webdav_search is None:
+            webdav_config = self._webdav_config
+            response = client.session.request(
+                'OPTIONS',
+                f"{webdav_config.get('url', '').rstrip('/')}/",
+                auth=(webdav_config.get('username'), webdav_config.get('password')),
+                verify=client.verify,
+                timeout=client.timeout
+            )
+            self._webdav_search = (response.ok and
+                                   'DAV:basicsearch' in response.headers.get('DASL', ''))
+        return self._webdav_search
+    
+    @_retry_on_disconnect
+    def _list_ftp_files(self) -> List[str]:
+        """List backup files over a pooled FTP connection"""
+        # A failed listing closes the connection instead of returning it to the pool
+        with self._ftp_connection() as ftp:
+            return self._ftp_backup_names(ftp)
+    
+    def _ftp_backup_names(self, ftp: ftplib.FTP) -> List[str]:
+        """List backup files in the current FTP directory"""
+        try:
+            # MLSD marks directories and links, so only regular files are returned.
+            # No facts= argument: it costs an OPTS MLST round trip on every listing,
+            # and servers include the type fact by default
+            names = [name for name, facts in ftp.mlsd()
+                     if facts.get('type', 'file') == 'file']
+        except ftplib.error_perm:
+            # Server without MLSD; some return paths rather than names from NLST
+            names = [name.rsplit('/', 1)[-1] for name in ftp.nlst()]
+        return [name for name in names if name.endswith(_LISTING_SUFFIXES)]
+    
+    def _ftp_backup_times(self, ftp: ftplib.FTP) -> Dict[str, Optional[datetime]]:
+        """Map backup files in the current FTP directory to their modification times"""
+        try:
+            # One round trip with structured facts for every entry
+            return {name: _parse_ftp_time(facts.get('modify'))
+                    for name, facts in ftp.mlsd(facts=['type', 'modify', 'size'])
+                    if facts.get('type') == 'file' and name.endswith(_BACKUP_SUFFIXES)}
+        except ftplib.error_perm:
+            pass  # Server without MLSD
+        
+        backup_times = {}
+        for name in ftp.nlst():
+            name = name.rsplit('/', 1)[-1]
+            if not name.endswith(_BACKUP_SUFFIXES):
+                continue
+            try:
+                backup_times[name] = _parse_ftp_time(ftp.voidcmd(f'MDTM {name}')[4:].strip())
+            except ftplib.error_perm:
+                backup_times[name] = None
+        return backup_times
+    
+    @_retry_on_disconnect
+    def _delete_ftp_file(self, filename: str):
+        """Delete a remote file over a pooled FTP connection"""
+        with self._ftp_connection() as ftp:
+            ftp.delete(filename)
+            if self.skip_unchanged:
+                # Caught inside the block so a missing sidecar keeps the connection pooled
+                try:
+                    ftp.delete(filename + _DIGEST_SUFFIX)
+                except ftplib.error_perm:
+                    pass  # Uploaded before skip_unchanged was enabled
     
     def download_backup(self, remote_filename: str, local_path: str) -> bool:
         """Download backup file from remote storage"""
@@ -643,118 +1607,76 @@ class RemoteStorageManager:
             else:
                 raise ValueError(f"Unsupported storage type: {self.storage_type}")
         except Exception as e:
-            print(f"Remote storage download error: {e}")
+            self.logger.warning("Remote storage download error: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False
     
     def _download_from_webdav(self, remote_filename: str, local_path: str) -> bool:
         """Download file from WebDAV server"""
-        webdav_config = self.remote_config.get('webdav', {})
+        webdav_config = self._webdav_config
         
         if not webdav_config:
             raise ValueError("WebDAV configuration not found")
         
-        # WebDAV client configuration
-        options = {
-            'webdav_hostname': webdav_config.get('url'),
-            'webdav_login': webdav_config.get('username'),
-            'webdav_password': webdav_config.get('password'),
-            'webdav_verify_ssl': webdav_config.get('verify_ssl', True)
-        }
-        
         try:
-            from webdav3.client import Client
-            client = Client(options)
-            
-            # Download file
-            client.download_sync(remote_path=remote_filename, local_path=local_path)
+            with self._webdav_connection() as client:
+                # Download file
+                client.download_sync(remote_path=remote_filename, local_path=local_path)
             return True
             
         except Exception as e:
-            print(f"WebDAV download error: {e}")
+            self.logger.warning("WebDAV download error: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False
     
     def _download_from_cifs(self, remote_filename: str, local_path: str) -> bool:
         """Download file from CIFS/Samba server"""
-        cifs_config = self.remote_config.get('cifs', {})
+        cifs_config = self._cifs_config
         
         if not cifs_config:
             raise ValueError("CIFS configuration not found")
         
-        server = cifs_config.get('server')
-        username = cifs_config.get('username')
-        password = cifs_config.get('password')
-        mount_point = cifs_config.get('mount_point', '/mnt/backup_storage')
-        auto_mount = cifs_config.get('auto_mount', True)
-        
-        if not server or not username or not password:
+        if not cifs_config.get('server') or not cifs_config.get('username') or not cifs_config.get('password'):
             raise ValueError("CIFS server, username, and password are required")
         
         try:
-            # Create mount point if it doesn't exist
-            os.makedirs(mount_point, exist_ok=True)
-            
-            # Mount CIFS share if auto_mount is enabled
-            if auto_mount:
-                # Check if already mounted
-                if not os.path.ismount(mount_point):
-                    self._mount_cifs_share(server, username, password, mount_point)
+            with self._cifs_mount(cifs_config) as mount_point:
+                # Copy file from CIFS share
+                remote_path = os.path.join(mount_point, remote_filename)
+                if os.path.exists(remote_path):
+                    self._copy_file(remote_path, local_path)
+                    return True
                 else:
-                    print(f"CIFS share already mounted at {mount_point}")
-            
-            # Check if mount point is accessible
-            if not os.path.ismount(mount_point):
-                raise ConnectionError(f"CIFS share not mounted at {mount_point}")
-            
-            # Copy file from CIFS share
-            remote_path = os.path.join(mount_point, remote_filename)
-            if os.path.exists(remote_path):
-                shutil.copy2(remote_path, local_path)
-                return True
-            else:
-                print(f"File not found on CIFS share: {remote_filename}")
-                return False
-                
+                    self.logger.warning("File not found on CIFS share: %s", remote_filename)
+                    return False
+                    
         except Exception as e:
-            print(f"CIFS download error: {e}")
+            self.logger.warning("CIFS download error: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False
-        finally:
-            # Unmount CIFS share if auto_mount is enabled
-            if auto_mount:
-                self._unmount_cifs_share(mount_point)
     
     def _download_from_ftp(self, remote_filename: str, local_path: str) -> bool:
         """Download file from FTP server"""
-        ftp_config = self.remote_config.get('ftp', {})
+        ftp_config = self._ftp_config
         
         if not ftp_config:
             raise ValueError("FTP configuration not found")
         
-        host = ftp_config.get('host')
-        username = ftp_config.get('username')
-        password = ftp_config.get('password')
-        port = ftp_config.get('port', 21)
-        
-        if not host or not username or not password:
+        if not ftp_config.get('host') or not ftp_config.get('username') or not ftp_config.get('password'):
             raise ValueError("FTP host, username, and password are required")
         
         try:
-            import ftplib
-            
-            # Connect to FTP server
-            ftp = ftplib.FTP()
-            ftp.connect(host, port)
-            ftp.login(username, password)
-            
-            # Download file
-            with open(local_path, 'wb') as local_file:
-                ftp.retrbinary(f'RETR {remote_filename}', local_file.write)
-            
-            # Close connection
-            ftp.quit()
+            # Download file from the remote directory uploads were stored in
+            with self._ftp_connection() as ftp:
+                decompress = self._enter_mode_z(ftp, remote_filename)
+                self._retr_file(ftp, f'RETR {remote_filename}', local_path, decompress=decompress)
+                if decompress:
+                    ftp.voidcmd('MODE S')
             return True
             
         except Exception as e:
-            print(f"FTP download error: {e}")
+            self.logger.warning("FTP download error: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False
     
     def list_backups(self) -> List[str]:
@@ -764,127 +1686,170 @@ class RemoteStorageManager:
         
         try:
             if self.storage_type == 'webdav':
-                return self._list_webdav_backups()
+                return self._cached_listing('webdav', self._list_webdav_backups)
             elif self.storage_type == 'cifs':
-                return self._list_cifs_backups()
+                return self._cached_listing('cifs', self._list_cifs_backups)
             elif self.storage_type == 'ftp':
-                return self._list_ftp_backups()
+                return self._cached_listing('ftp', self._list_ftp_backups)
             else:
                 raise ValueError(f"Unsupported storage type: {self.storage_type}")
         except Exception as e:
-            print(f"Remote storage list error: {e}")
+            self.logger.warning("Remote storage list error: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return []
     
+    def _cached_listing(self, storage_type: str, list_backups) -> List[str]:
+        """Return a recent listing of a backend, listing it again once the cached one expires"""
+        now = time.monotonic()
+        cached = self._listing_cache.get(storage_type)
+        if cached is not None and cached[0] > now:
+            return list(cached[1])
+        
+        backup_files = list_backups()
+        ttl = self.listing_ttl if backup_files else min(self.listing_ttl, _EMPTY_LISTING_TTL)
+        if ttl > 0:
+            self._listing_cache[storage_type] = (now + ttl, backup_files)
+        return list(backup_files)
+    
+    async def warmup(self):
+        """
+        Connect to every configured backend concurrently
+        
+        Opens a pooled WebDAV client and FTP login and mounts (or opens an SMB
+        session to) the CIFS share side by side, so later operations find them
+        ready and startup pays for the slowest handshake instead of all of them.
+        Failures are only logged, the operation that needs the backend reports them.
+        """
+        warmers = {
+            'webdav': self._warm_webdav,
+            'cifs': self._warm_cifs,
+            'ftp': self._warm_ftp
+        }
+        configured = [storage_type for storage_type in warmers if self.remote_config.get(storage_type)]
+        
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, warmers[storage_type]) for storage_type in configured),
+            return_exceptions=True
+        )
+        for storage_type, result in zip(configured, results):
+            if isinstance(result, Exception):
+                self.logger.warning("Could not connect to %s storage in advance: %s", storage_type, result)
+    
+    def _warm_webdav(self):
+        """Open a WebDAV connection and leave it in the pool"""
+        with self._webdav_connection() as client:
+            client.check()
+    
+    def _warm_ftp(self):
+        """Log in to the FTP server and leave the connection in the pool"""
+        with self._ftp_connection():
+            pass
+    
+    def _warm_cifs(self):
+        """Mount the CIFS share or open the SMB session uploads will use"""
+        with self._cifs_files() as (path_of, _, _):
+            path_of('')
+    
+    async def list_all_remote_backups(self) -> Dict[str, List[str]]:
+        """
+        List backup files on every configured backend concurrently
+        
+        Each backend listing is a few network round trips, so they run side by
+        side and the call takes as long as the slowest one instead of the sum.
+        
+        Returns:
+            Backup file names keyed by storage type, for each backend with a
+            configuration section; a backend that fails maps to an empty list
+        """
+        if not self.is_enabled():
+            return {}
+        
+        listers = {
+            'webdav': self._list_webdav_backups,
+            'cifs': self._list_cifs_backups,
+            'ftp': self._list_ftp_backups
+        }
+        configured = [storage_type for storage_type in listers if self.remote_config.get(storage_type)]
+        
+        # The clients are blocking, run each listing on the default executor
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, self._cached_listing, storage_type, listers[storage_type])
+              for storage_type in configured),
+            return_exceptions=True
+        )
+        
+        backups = {}
+        for storage_type, result in zip(configured, results):
+            if isinstance(result, Exception):
+                self.logger.error("Error listing %s backups: %s", storage_type, result)
+                result = []
+            backups[storage_type] = result
+        return backups
+    
     def _list_webdav_backups(self) -> List[str]:
         """List backup files from WebDAV server"""
-        webdav_config = self.remote_config.get('webdav', {})
+        webdav_config = self._webdav_config
         
         if not webdav_config:
             return []
-        
-        # WebDAV client configuration
-        options = {
-            'webdav_hostname': webdav_config.get('url'),
-            'webdav_login': webdav_config.get('username'),
-            'webdav_password': webdav_config.get('password'),
-            'webdav_verify_ssl': webdav_config.get('verify_ssl', True)
-        }
+        if Client is None:
+            self.logger.warning("WebDAV listing skipped: webdavclient3 is not installed")
+            return []
         
         try:
-            from webdav3.client import Client
-            client = Client(options)
-            
-            # List files
-            files = client.list()
-            backup_files = [f for f in files if f.endswith(('.dump', '.sql', '.dump.gz', '.sql.gz'))]
+            # List files over a pooled client
+            files = self._list_webdav_files()
+            backup_files = [f for f in files if f.endswith(_LISTING_SUFFIXES)]
             return backup_files
             
         except Exception as e:
-            print(f"WebDAV list error: {e}")
+            self.logger.warning("WebDAV list error: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return []
     
     def _list_cifs_backups(self) -> List[str]:
         """List backup files from CIFS/Samba server"""
-        cifs_config = self.remote_config.get('cifs', {})
+        cifs_config = self._cifs_config
         
         if not cifs_config:
             return []
         
-        server = cifs_config.get('server')
-        username = cifs_config.get('username')
-        password = cifs_config.get('password')
-        mount_point = cifs_config.get('mount_point', '/mnt/backup_storage')
-        auto_mount = cifs_config.get('auto_mount', True)
-        
-        if not server or not username or not password:
+        if not cifs_config.get('server') or not cifs_config.get('username') or not cifs_config.get('password'):
             return []
         
         try:
-            # Create mount point if it doesn't exist
-            os.makedirs(mount_point, exist_ok=True)
-            
-            # Mount CIFS share if auto_mount is enabled
-            if auto_mount:
-                # Check if already mounted
-                if not os.path.ismount(mount_point):
-                    self._mount_cifs_share(server, username, password, mount_point)
-                else:
-                    print(f"CIFS share already mounted at {mount_point}")
-            
-            # Check if mount point is accessible
-            if not os.path.ismount(mount_point):
-                return []
-            
-            # List files
-            backup_files = []
-            for file_path in Path(mount_point).iterdir():
-                if file_path.is_file():
-                    # Check for backup file extensions (including compressed)
-                    if (file_path.suffix in ['.dump', '.sql'] or 
-                        file_path.suffixes in [['.dump', '.gz'], ['.sql', '.gz']]):
-                        backup_files.append(file_path.name)
-            
-            return backup_files
-            
+            with self._cifs_mount(cifs_config) as mount_point:
+                # List files; the name test is free, so only matching entries
+                # pay for the file type check (usually answered by the dirent).
+                # One pass on purpose: per-suffix globs would each read the
+                # directory again, and the kernel CIFS client always enumerates
+                # with "*", so no filtering would happen on the server
+                with os.scandir(mount_point) as entries:
+                    return [entry.name for entry in entries
+                            if entry.name.endswith(_LISTING_SUFFIXES)
+                            and entry.is_file(follow_symlinks=False)]
+                
         except Exception as e:
-            print(f"CIFS list error: {e}")
+            self.logger.warning("CIFS list error: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return []
-        finally:
-            # Unmount CIFS share if auto_mount is enabled
-            if auto_mount:
-                self._unmount_cifs_share(mount_point)
     
     def _list_ftp_backups(self) -> List[str]:
         """List backup files from FTP server"""
-        ftp_config = self.remote_config.get('ftp', {})
+        ftp_config = self._ftp_config
         
         if not ftp_config:
             return []
         
-        host = ftp_config.get('host')
-        username = ftp_config.get('username')
-        password = ftp_config.get('password')
-        port = ftp_config.get('port', 21)
-        
-        if not host or not username or not password:
+        if not ftp_config.get('host') or not ftp_config.get('username') or not ftp_config.get('password'):
             return []
         
         try:
-            import ftplib
-            
-            # Connect to FTP server
-            ftp = ftplib.FTP()
-            ftp.connect(host, port)
-            ftp.login(username, password)
-            
-            # List files
-            files = ftp.nlst()
-            backup_files = [f for f in files if f.endswith(('.dump', '.sql', '.dump.gz', '.sql.gz'))]
-            
-            # Close connection
-            ftp.quit()
-            return backup_files
+            return self._list_ftp_files()
             
         except Exception as e:
-            print(f"FTP list error: {e}")
+            self.logger.warning("FTP list error: %s", e,
+                                exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return []
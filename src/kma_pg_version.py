@@ -7,10 +7,62 @@ Centralized version management for the project and individual scripts.
 """
 
 import json
+import os
 import re
 from pathlib import Path
 from typing import Dict, Tuple, Optional
 
+try:
+    import orjson  # optional: faster VERSION parsing and serialization
+except ImportError:
+    orjson = None
+
+# Strict X.Y.Z version format
+_VERSION_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)$')
+
+# Per increment type: amounts added to major/minor/patch, and whether minor/patch reset to 0
+_BUMP_MASK = {
+    "major": (1, 0, 0, True, True),
+    "minor": (0, 1, 0, False, True),
+    "patch": (0, 0, 1, False, False)
+}
+
+
+def _bump(version: Tuple[int, int, int], increment_type: str) -> Tuple[int, int, int]:
+    """Increment a version tuple; unknown increment types bump the patch"""
+    add_major, add_minor, add_patch, reset_minor, reset_patch = _BUMP_MASK.get(increment_type, _BUMP_MASK["patch"])
+    major, minor, patch = version
+    return (major + add_major,
+            0 if reset_minor else minor + add_minor,
+            0 if reset_patch else patch + add_patch)
+
+
+def _reconcile_project(project: Tuple[int, int, int], script: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    """Return the project version after a script moved to the given version"""
+    project_major, project_minor, project_patch = project
+    script_major, script_minor, script_patch = script
+    # A newer script major or minor moves the project to it and resets the patch
+    if script_major > project_major:
+        return script_major, 0, 0
+    if script_major == project_major and script_minor > project_minor:
+        return project_major, script_minor, 0
+    # Otherwise only the patch level follows the script (see VERSIONING.md)
+    return project_major, project_minor, max(project_patch, script_patch)
+
+
+def _json_loads(data: bytes) -> Dict:
+    """Parse VERSION file contents"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(versions: Dict) -> bytes:
+    """Serialize versions as UTF-8 JSON indented by two spaces"""
+    if orjson is not None:
+        return orjson.dumps(versions, option=orjson.OPT_INDENT_2)
+    return json.dumps(versions, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class VersionManager:
     """Version management system for project and scripts"""
@@ -18,14 +70,17 @@ class VersionManager:
     def __init__(self, version_file: str = "VERSION"):
         """Initialize version manager"""
         self.version_file = Path(version_file)
+        # File contents as last read or written, to skip saves that change nothing
+        self._saved_text: Optional[bytes] = None
         self.versions = self._load_versions()
     
     def _load_versions(self) -> Dict[str, str]:
         """Load versions from file or create default"""
         if self.version_file.exists():
             try:
-                with open(self.version_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                versions = _json_loads(self.version_file.read_bytes())
+                self._saved_text = _json_dumps(versions)
+                return versions
             except (json.JSONDecodeError, FileNotFoundError):
                 pass
         
@@ -44,13 +99,26 @@ class VersionManager:
         }
     
     def _save_versions(self):
-        """Save versions to file"""
-        with open(self.version_file, 'w', encoding='utf-8') as f:
-            json.dump(self.versions, f, indent=2, ensure_ascii=False)
+        """Save versions to file, replacing it atomically"""
+        text = _json_dumps(self.versions)
+        if text == self._saved_text:
+            return
+        
+        # Write a temporary file and rename it over the old one, so an
+        # interrupted save never leaves a truncated VERSION file behind
+        tmp_file = self.version_file.with_name(self.version_file.name + '.tmp')
+        tmp_file.write_bytes(text)
+        os.replace(tmp_file, self.version_file)
+        self._saved_text = text
     
     def _parse_version(self, version: str) -> Tuple[int, int, int]:
         """Parse version string to tuple (major, minor, patch)"""
-        match = re.match(r'^(\d+)\.(\d+)\.(\d+)$', version)
+        # Plain X.Y.Z is by far the common case and needs no regex
+        parts = version.split('.')
+        if len(parts) == 3 and all(part.isdecimal() and part.isascii() for part in parts):
+            return int(parts[0]), int(parts[1]), int(parts[2])
+        
+        match = _VERSION_RE.match(version)
         if not match:
             raise ValueError(f"Invalid version format: {version}")
         return tuple(int(x) for x in match.groups())
@@ -69,49 +137,22 @@ class VersionManager:
     
     def get_full_version(self, script_name: str) -> str:
         """Get full version in format 'project_version/script_version'"""
-        project_ver = self.get_project_version()
-        script_ver = self.get_script_version(script_name)
-        return f"{project_ver}/{script_ver}"
+        # Formatting two short strings is cheaper than an lru_cache lookup, so
+        # only the getter calls are inlined
+        return f"{self.versions['project']}/{self.versions['scripts'].get(script_name, '1.0.0')}"
     
     def increment_script_version(self, script_name: str, increment_type: str = "patch") -> str:
         """Increment script version and update project version if needed"""
         if script_name not in self.versions["scripts"]:
             self.versions["scripts"][script_name] = "1.0.0"
         
-        # Parse current versions
-        project_major, project_minor, project_patch = self._parse_version(self.versions["project"])
-        script_major, script_minor, script_patch = self._parse_version(self.versions["scripts"][script_name])
-        
         # Increment script version
-        if increment_type == "major":
-            script_major += 1
-            script_minor = 0
-            script_patch = 0
-        elif increment_type == "minor":
-            script_minor += 1
-            script_patch = 0
-        else:  # patch
-            script_patch += 1
-        
-        new_script_version = self._format_version(script_major, script_minor, script_patch)
-        self.versions["scripts"][script_name] = new_script_version
+        script = _bump(self._parse_version(self.versions["scripts"][script_name]), increment_type)
+        self.versions["scripts"][script_name] = self._format_version(*script)
         
         # Update project version based on script version
-        if script_major > project_major or (script_major == project_major and script_minor > project_minor):
-            # Major or minor increment in script requires project version update
-            if script_major > project_major:
-                project_major = script_major
-                project_minor = 0
-                project_patch = 0
-            else:
-                project_minor = script_minor
-                project_patch = 0
-        elif script_patch > project_patch:
-            # Patch increment in script requires project patch update
-            project_patch = script_patch
-        
-        new_project_version = self._format_version(project_major, project_minor, project_patch)
-        self.versions["project"] = new_project_version
+        project = _reconcile_project(self._parse_version(self.versions["project"]), script)
+        self.versions["project"] = self._format_version(*project)
         
         # Save changes
         self._save_versions()
@@ -121,29 +162,14 @@ class VersionManager:
     def set_script_version(self, script_name: str, version: str) -> str:
         """Set specific script version and update project version if needed"""
         # Validate version format
-        self._parse_version(version)
-        
-        # Parse versions
-        project_major, project_minor, project_patch = self._parse_version(self.versions["project"])
-        script_major, script_minor, script_patch = self._parse_version(version)
+        script = self._parse_version(version)
+        project = self._parse_version(self.versions["project"])
         
         # Update script version
         self.versions["scripts"][script_name] = version
         
         # Update project version if needed
-        if script_major > project_major or (script_major == project_major and script_minor > project_minor):
-            if script_major > project_major:
-                project_major = script_major
-                project_minor = 0
-                project_patch = 0
-            else:
-                project_minor = script_minor
-                project_patch = 0
-        elif script_patch > project_patch:
-            project_patch = script_patch
-        
-        new_project_version = self._format_version(project_major, project_minor, project_patch)
-        self.versions["project"] = new_project_version
+        self.versions["project"] = self._format_version(*_reconcile_project(project, script))
         
         # Save changes
         self._save_versions()
@@ -152,35 +178,42 @@ class VersionManager:
     
     def list_versions(self) -> Dict[str, str]:
         """List all versions"""
-        result = {"project": self.versions["project"]}
-        for script, version in self.versions["scripts"].items():
-            result[script] = f"{self.versions['project']}/{version}"
-        return result
+        project = self.versions["project"]
+        return {"project": project,
+                **{script: f"{project}/{version}" for script, version in self.versions["scripts"].items()}}
     
     def get_version_info(self) -> Dict[str, any]:
         """Get detailed version information"""
+        project = self.versions["project"]
         return {
-            "project_version": self.versions["project"],
-            "scripts": {
-                script: {
-                    "script_version": version,
-                    "full_version": f"{self.versions['project']}/{version}"
-                }
+            "project_version": project,
+            "scripts": dict(
+                (script, {"script_version": version, "full_version": f"{project}/{version}"})
                 for script, version in self.versions["scripts"].items()
-            }
+            )
         }
 
 
+# VersionManager for the default VERSION file, shared by the convenience functions
+_DEFAULT_VM: Optional[VersionManager] = None
+
+
+def _get_default_vm() -> VersionManager:
+    """Return the shared VersionManager, reading the VERSION file on first use"""
+    global _DEFAULT_VM
+    if _DEFAULT_VM is None:
+        _DEFAULT_VM = VersionManager()
+    return _DEFAULT_VM
+
+
 def get_version(script_name: str) -> str:
     """Convenience function to get full version for a script"""
-    vm = VersionManager()
-    return vm.get_full_version(script_name)
+    return _get_default_vm().get_full_version(script_name)
 
 
 def increment_version(script_name: str, increment_type: str = "patch") -> str:
     """Convenience function to increment script version"""
-    vm = VersionManager()
-    return vm.increment_script_version(script_name, increment_type)
+    return _get_default_vm().increment_script_version(script_name, increment_type)
 
 
 def main():
@@ -202,11 +235,9 @@ def main():
     
     if args.list:
         versions = vm.list_versions()
-        print("Project and Script Versions:")
-        print(f"Project: {versions['project']}")
-        for script, version in versions.items():
-            if script != 'project':
-                print(f"  {script}: {version}")
+        lines = ["Project and Script Versions:", f"Project: {versions['project']}"]
+        lines.extend(f"  {script}: {version}" for script, version in versions.items() if script != 'project')
+        print("\n".join(lines))
     
     elif args.get:
         version = vm.get_full_version(args.get)